@@ -237,13 +237,17 @@ def main():
 
     elif args.command == 'mcp':
         # Handle MCP server command separately
-        from andes.mcp.server import mcp
-        print(f"Starting ANDES MCP Server...", file=sys.stderr)
+        from andes.mcp.server import mcp, start_cases_warmup
         if args.http:
-            print(f"HTTP mode: {args.host}:{args.port}", file=sys.stderr)
+            mode_info = f"HTTP mode: {args.host}:{args.port}"
+        else:
+            mode_info = "STDIO mode (for Claude Desktop)"
+        sys.stderr.write(f"Starting ANDES MCP Server...\n{mode_info}\n")
+        sys.stderr.flush()
+        if args.http:
+            start_cases_warmup()
             mcp.run(transport="http", host=args.host, port=args.port)
         else:
-            print("STDIO mode (for Claude Desktop)", file=sys.stderr)
             mcp.run()
         return
 
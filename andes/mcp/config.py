@@ -1,7 +1,44 @@
 import os
+from collections import deque
 from pathlib import Path
 from typing import Optional
 
+# File extensions recognized as loadable test cases
+CASE_EXTENSIONS = (".xlsx", ".raw")
+
+
+def _scan_case_files(root: str, extensions: tuple = CASE_EXTENSIONS) -> list[str]:
+    """
+    Walk a directory tree once with ``os.scandir`` and collect matching files.
+
+    Subdirectories are visited from a queue rather than by recursion, and
+    relative paths are sliced from ``DirEntry.path`` without building
+    ``Path`` objects.
+
+    Parameters
+    ----------
+    root : str
+        Directory to walk
+    extensions : tuple
+        Lower-case file extensions to match
+
+    Returns
+    -------
+    list[str]
+        Paths relative to ``root`` using "/" as separator
+    """
+    prefix_len = len(os.path.join(root, ""))
+    matches = []
+    pending = deque([root])
+    while pending:
+        with os.scandir(pending.popleft()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.lower().endswith(extensions):
+                    matches.append(entry.path[prefix_len:].replace(os.sep, "/"))
+    return matches
+
 
 class MCPConfig:
     """Configuration for the MCP server"""
@@ -14,10 +51,14 @@ class MCPConfig:
     # Session management
     SESSION_TIMEOUT = 3600  # 1 hour in seconds
     MAX_SESSIONS = 100
+    # Loaded systems kept for reuse; 0 disables. Off by default because a deep
+    # copy of a System costs about as much as loading the case again
+    CASE_TEMPLATE_CACHE_SIZE = 0
 
     # File paths
     ANDES_ROOT = Path(__file__).parent.parent
     CASES_DIR = ANDES_ROOT / "cases"
+    CASES_DIR_STR = str(CASES_DIR)
 
     # Simulation defaults
     DEFAULT_TDS_TF = 20.0  # Default simulation end time
@@ -27,6 +68,10 @@ class MCPConfig:
     MAX_RESULT_POINTS = 10000  # Maximum data points to return in a single query
     DEFAULT_OUTPUT_FORMAT = "json"
 
+    # Cached result of `list_all_cases` and the directory stamp it was built from
+    _cases_cache: Optional[list[str]] = None
+    _cases_cache_key: Optional[tuple] = None
+
     @classmethod
     def get_case_path(cls, case_name: str) -> Optional[Path]:
         """
@@ -42,25 +87,53 @@ class MCPConfig:
         Optional[Path]
             Full path to case file if it exists, None otherwise
         """
-        case_path = cls.CASES_DIR / case_name
-        return case_path if case_path.exists() else None
+        case_path = os.path.join(cls.CASES_DIR_STR, case_name)
+        return Path(case_path) if os.path.isfile(case_path) else None
+
+    @classmethod
+    def _cases_dir_key(cls) -> Optional[tuple]:
+        """
+        Build a cache key from the modification stamps of the cases directory.
+
+        The key covers ``CASES_DIR`` itself and its immediate subdirectories,
+        which is where case files are added or removed.
+
+        Returns
+        -------
+        Optional[tuple]
+            Hashable stamp of the directory tree, None if it does not exist
+        """
+        try:
+            st = os.stat(cls.CASES_DIR_STR)
+            with os.scandir(cls.CASES_DIR_STR) as it:
+                subdirs = [(entry.name, entry.stat(follow_symlinks=False).st_mtime_ns)
+                           for entry in it if entry.is_dir(follow_symlinks=False)]
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_ino, tuple(sorted(subdirs))
 
     @classmethod
     def list_all_cases(cls) -> list[str]:
         """
         List all available test case files.
 
+        The result is cached and reused until the modification time of the
+        cases directory or one of its subdirectories changes.
+
         Returns
         -------
         list[str]
             List of relative paths to test case files
         """
-        cases = []
-        if cls.CASES_DIR.exists():
-            for case_file in cls.CASES_DIR.rglob("*.xlsx"):
-                rel_path = case_file.relative_to(cls.CASES_DIR)
-                cases.append(str(rel_path).replace("\\", "/"))
-            for case_file in cls.CASES_DIR.rglob("*.raw"):
-                rel_path = case_file.relative_to(cls.CASES_DIR)
-                cases.append(str(rel_path).replace("\\", "/"))
-        return sorted(cases)
+        key = cls._cases_dir_key()
+        if key is None:
+            return []
+        if cls._cases_cache is not None and cls._cases_cache_key == key:
+            return list(cls._cases_cache)
+
+        cases = _scan_case_files(cls.CASES_DIR_STR)
+        cases.sort()
+
+        cls._cases_cache = cases
+        cls._cases_cache_key = key
+        return list(cases)
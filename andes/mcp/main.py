@@ -9,7 +9,7 @@
 
 import argparse
 import sys
-from .server import mcp
+from .server import mcp, start_cases_warmup
 
 
 def main():
@@ -36,13 +36,19 @@ def main():
 
     args = parser.parse_args()
 
-    print(f"Starting ANDES MCP Server...", file=sys.stderr)
+    if args.http:
+        mode_info = f"HTTP mode: {args.host}:{args.port}"
+    else:
+        mode_info = "STDIO mode (for Claude Desktop)"
+
+    # Single write so the banner is not interleaved with client output
+    sys.stderr.write(f"Starting ANDES MCP Server...\n{mode_info}\n")
+    sys.stderr.flush()
 
     if args.http:
-        print(f"HTTP mode: {args.host}:{args.port}", file=sys.stderr)
+        start_cases_warmup()
         mcp.run(transport="http", host=args.host, port=args.port)
     else:
-        print("STDIO mode (for Claude Desktop)", file=sys.stderr)
         mcp.run()
 
 
@@ -1,8 +1,41 @@
 import logging
+import os
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+LLMS_TXT_PATH = Path(__file__).parent / "llms.txt"
+
+# Cached llms.txt content as (mtime_ns, text)
+_llms_txt_cache = None
+
+
+def _read_llms_txt() -> str:
+    """
+    Get the llms.txt content, re-reading the file only when its modification time changes.
+
+    Returns a placeholder if the file does not exist. Read errors propagate
+    to the caller.
+    """
+    global _llms_txt_cache
+
+    try:
+        mtime = os.stat(LLMS_TXT_PATH).st_mtime_ns
+    except FileNotFoundError:
+        logger.warning(f"llms.txt not found at {LLMS_TXT_PATH}")
+        return f"# ANDES Documentation\n\n> llms.txt file not found at: {LLMS_TXT_PATH}\n\nPlease ensure the file exists in the andes/mcp/ directory."
+
+    if _llms_txt_cache is None or _llms_txt_cache[0] != mtime:
+        _llms_txt_cache = (mtime, LLMS_TXT_PATH.read_text(encoding='utf-8'))
+    return _llms_txt_cache[1]
+
+
+# Load once at import so the first request is served from memory
+try:
+    _read_llms_txt()
+except OSError as e:
+    logger.error(f"Error reading llms.txt: {e}")
+
 
 def register_documentation_resources(mcp):
     """
@@ -11,8 +44,6 @@ def register_documentation_resources(mcp):
     Exposes llms.txt as an MCP resource for LLM to read and interpret directly.
     """
 
-    llms_txt_path = Path(__file__).parent / "llms.txt"
-
     @mcp.resource("andes://docs/llms.txt")
     def get_llms_txt() -> str:
         """
@@ -42,11 +73,7 @@ def register_documentation_resources(mcp):
         Format: Follows llmstxt.org standard with markdown formatting
         """
         try:
-            if llms_txt_path.exists():
-                return llms_txt_path.read_text(encoding='utf-8')
-            else:
-                logger.warning(f"llms.txt not found at {llms_txt_path}")
-                return f"# ANDES Documentation\n\n> llms.txt file not found at: {llms_txt_path}\n\nPlease ensure the file exists in the andes/mcp/ directory."
+            return _read_llms_txt()
         except Exception as e:
             logger.error(f"Error reading llms.txt: {e}")
             return f"# Error\n\nFailed to read llms.txt: {str(e)}"
@@ -1,3 +1,5 @@
+import threading
+
 from fastmcp import FastMCP
 from .config import MCPConfig
 
@@ -14,10 +16,21 @@ register_results_tools(mcp)
 register_documentation_resources(mcp)
 
 
-@mcp.resource("server://info")
-def get_server_info() -> str:
-    """Get information about the ANDES MCP server"""
-    return f"""
+def start_cases_warmup() -> threading.Thread:
+    """
+    Populate the case list cache in a background thread.
+
+    Used in HTTP mode so that the first `list_available_cases` call does not
+    pay for the directory walk.
+    """
+    thread = threading.Thread(target=MCPConfig.list_all_cases,
+                              name="andes-mcp-cases-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+# Server information is static, so build it once at import
+_SERVER_INFO = f"""
 # ANDES MCP Server
 
 Version: {MCPConfig.VERSION}
@@ -41,6 +54,7 @@ Description: {MCPConfig.DESCRIPTION}
 - get_pflow_results: Get power flow results
 - get_tds_results: Get time-domain simulation results
 - list_tds_variables: List available TDS variables
+- export_tds_results: Write time-domain results to a newline-delimited JSON file
 
 ## Available Resources
 
@@ -63,5 +77,11 @@ Description: {MCPConfig.DESCRIPTION}
 """
 
 
+@mcp.resource("server://info")
+def get_server_info() -> str:
+    """Get information about the ANDES MCP server"""
+    return _SERVER_INFO
+
+
 if __name__ == "__main__":
     mcp.run()
@@ -1,5 +1,6 @@
 from typing import Optional
-from ..utils import get_session_manager, serialize_pflow_results, serialize_tds_results
+from ..utils import (SESSIONS, mcp_tool_safe, serialize_eig_results, serialize_pflow_results,
+                     serialize_tds_results)
 from ..config import MCPConfig
 
 
@@ -7,6 +8,7 @@ def register_analysis_tools(mcp):
     """Register analysis tools with the MCP server"""
 
     @mcp.tool()
+    @mcp_tool_safe("Error running power flow")
     def run_power_flow(
         session_id: str,
         tol: Optional[float] = None,
@@ -40,40 +42,35 @@ def register_analysis_tools(mcp):
             ...
         }
         """
-        session_manager = get_session_manager()
-        system = session_manager.get_system(session_id)
+        session = SESSIONS.get_session(session_id)
 
-        if system is None:
+        if session is None:
             return {
                 "success": False,
                 "error": f"Session not found: {session_id}"
             }
 
-        try:
-            # Apply config overrides if provided
-            if tol is not None:
-                system.PFlow.config.tol = float(tol)
-            if max_iter is not None:
-                system.PFlow.config.max_iter = int(max_iter)
-            if method is not None:
-                system.PFlow.config.method = method
+        system = session.system
 
-            # Run power flow
-            converged = system.PFlow.run()
+        # Apply config overrides if provided
+        if tol is not None:
+            system.PFlow.config.tol = float(tol)
+        if max_iter is not None:
+            system.PFlow.config.max_iter = int(max_iter)
+        if method is not None:
+            system.PFlow.config.method = method
 
-            # Serialize results
-            results = serialize_pflow_results(system)
-            results["success"] = True
+        # Run power flow
+        converged = system.PFlow.run()
 
-            return results
+        # Serialize results
+        results = serialize_pflow_results(system, session.gen_models)
+        results["success"] = True
 
-        except Exception as e:
-            return {
-                "success": False,
-                "error": f"Error running power flow: {str(e)}"
-            }
+        return results
 
     @mcp.tool()
+    @mcp_tool_safe("Error running time-domain simulation")
     def run_time_domain(
         session_id: str,
         tf: Optional[float] = None,
@@ -109,8 +106,7 @@ def register_analysis_tools(mcp):
             "n_points": 600
         }
         """
-        session_manager = get_session_manager()
-        system = session_manager.get_system(session_id)
+        system = SESSIONS.get_system(session_id)
 
         if system is None:
             return {
@@ -118,46 +114,40 @@ def register_analysis_tools(mcp):
                 "error": f"Session not found: {session_id}"
             }
 
-        try:
-            # Ensure power flow has been run
-            if not system.PFlow.converged:
-                return {
-                    "success": False,
-                    "error": "Power flow must be run successfully before time-domain simulation"
-                }
-
-            # Apply config overrides
-            if tf is not None:
-                system.TDS.config.tf = float(tf)
-            else:
-                system.TDS.config.tf = MCPConfig.DEFAULT_TDS_TF
-
-            if tstep is not None:
-                system.TDS.config.tstep = float(tstep)
-            if tol is not None:
-                system.TDS.config.tol = float(tol)
-            if method is not None:
-                system.TDS.set_method(method)
-
-            # Run TDS
-            success = system.TDS.run()
-
-            return {
-                "success": True,
-                "converged": success and not system.TDS.busted,
-                "exec_time": float(system.TDS.exec_time) if hasattr(system.TDS, 'exec_time') else None,
-                "time_range": [float(system.TDS.config.t0), float(system.TDS.config.tf)],
-                "n_points": len(system.dae.ts.t),
-                "message": "Time-domain simulation completed. Use get_tds_results to retrieve data."
-            }
-
-        except Exception as e:
+        # Ensure power flow has been run
+        if not system.PFlow.converged:
             return {
                 "success": False,
-                "error": f"Error running time-domain simulation: {str(e)}"
+                "error": "Power flow must be run successfully before time-domain simulation"
             }
 
+        # Apply config overrides
+        if tf is not None:
+            system.TDS.config.tf = float(tf)
+        else:
+            system.TDS.config.tf = MCPConfig.DEFAULT_TDS_TF
+
+        if tstep is not None:
+            system.TDS.config.tstep = float(tstep)
+        if tol is not None:
+            system.TDS.config.tol = float(tol)
+        if method is not None:
+            system.TDS.set_method(method)
+
+        # Run TDS
+        success = system.TDS.run()
+
+        return {
+            "success": True,
+            "converged": success and not system.TDS.busted,
+            "exec_time": float(system.TDS.exec_time) if hasattr(system.TDS, 'exec_time') else None,
+            "time_range": [float(system.TDS.config.t0), float(system.TDS.config.tf)],
+            "n_points": len(system.dae.ts.t),
+            "message": "Time-domain simulation completed. Use get_tds_results to retrieve data."
+        }
+
     @mcp.tool()
+    @mcp_tool_safe("Error running eigenvalue analysis")
     def run_eigenvalue(session_id: str) -> dict:
         """
         Run eigenvalue analysis on a loaded system.
@@ -180,8 +170,7 @@ def register_analysis_tools(mcp):
             }
         }
         """
-        session_manager = get_session_manager()
-        system = session_manager.get_system(session_id)
+        system = SESSIONS.get_system(session_id)
 
         if system is None:
             return {
@@ -189,26 +178,17 @@ def register_analysis_tools(mcp):
                 "error": f"Session not found: {session_id}"
             }
 
-        try:
-            # Ensure power flow has been run
-            if not system.PFlow.converged:
-                return {
-                    "success": False,
-                    "error": "Power flow must be run successfully before eigenvalue analysis"
-                }
-
-            # Run eigenvalue analysis
-            system.EIG.run()
-
-            # Import serialization here to avoid circular import
-            from ..utils.serialization import serialize_eig_results
-            results = serialize_eig_results(system)
-            results["success"] = True
-
-            return results
-
-        except Exception as e:
+        # Ensure power flow has been run
+        if not system.PFlow.converged:
             return {
                 "success": False,
-                "error": f"Error running eigenvalue analysis: {str(e)}"
+                "error": "Power flow must be run successfully before eigenvalue analysis"
             }
+
+        # Run eigenvalue analysis
+        system.EIG.run()
+
+        results = serialize_eig_results(system)
+        results["success"] = True
+
+        return results
@@ -1,12 +1,17 @@
+import os
 from typing import Optional, List
-from ..utils import get_session_manager, serialize_pflow_results, serialize_tds_results
+from ..utils import (SESSIONS, compress_json, iter_tds_results, mcp_tool_safe,
+                     serialize_pflow_results, serialize_tds_results)
 from ..config import MCPConfig
 
+MAX_RESULT_POINTS = MCPConfig.MAX_RESULT_POINTS
+
 
 def register_results_tools(mcp):
     """Register results tools with the MCP server"""
 
     @mcp.tool()
+    @mcp_tool_safe("Error retrieving power flow results")
     def get_pflow_results(session_id: str) -> dict:
         """
         Get power flow calculation results.
@@ -34,37 +39,36 @@ def register_results_tools(mcp):
             "generators": {...}
         }
         """
-        session_manager = get_session_manager()
-        system = session_manager.get_system(session_id)
+        session = SESSIONS.get_session(session_id)
 
-        if system is None:
+        if session is None:
             return {
                 "success": False,
                 "error": f"Session not found: {session_id}"
             }
 
-        try:
-            if not hasattr(system, 'PFlow'):
-                return {
-                    "success": False,
-                    "error": "Power flow routine not available"
-                }
-
-            results = serialize_pflow_results(system)
-            results["success"] = True
-            return results
+        system = session.system
 
-        except Exception as e:
+        if not hasattr(system, 'PFlow'):
             return {
                 "success": False,
-                "error": f"Error retrieving power flow results: {str(e)}"
+                "error": "Power flow routine not available"
             }
 
+        results = serialize_pflow_results(system, session.gen_models)
+        results["success"] = True
+        return results
+
     @mcp.tool()
+    @mcp_tool_safe("Error retrieving TDS results")
     def get_tds_results(
         session_id: str,
         variables: Optional[List[str]] = None,
-        max_points: Optional[int] = None
+        max_points: Optional[int] = None,
+        encoding: str = "json",
+        dtype: str = "float32",
+        downsample: str = "stride",
+        compress: bool = False
     ) -> dict:
         """
         Get time-domain simulation results.
@@ -75,6 +79,27 @@ def register_results_tools(mcp):
                     If None, returns all state variables
         - max_points: Maximum number of data points to return (optional)
                      If provided and exceeded, data will be downsampled
+        - encoding: "json" (default) returns lists of floats; "binary" returns each
+                    array as {"dtype", "shape", "data"} with base64-encoded
+                    little-endian values, about 8x smaller for long simulations;
+                    "arrow" returns all series as one base64 Arrow IPC stream in
+                    "data", with "time" as the first column (requires pyarrow)
+        - dtype: Value precision - "float16", "float32" (default) or "float64".
+                 Sets the value type for binary and Arrow encoding. JSON values
+                 are rounded to 4 or 7 significant digits for float16 and
+                 float32, roughly halving the response; use "float64" for
+                 full precision.
+        - downsample: "stride" (default) keeps every n-th point; "minmax" keeps the
+                      minimum and maximum of each bucket so peaks are preserved.
+                      With "minmax", the two points of a bucket are stamped with
+                      the bucket's first and last times, not the times at which
+                      the extrema occurred, so peaks may shift by up to one
+                      bucket. "downsample_method" in the result reports the
+                      method used; "stride" is used if max_points is below 2.
+        - compress: If True and the response exceeds 64 KiB, return
+                    {"success", "compression": "zstd", "size", "data"} where "data"
+                    is the base64 zstd-compressed JSON of the full response
+                    (requires zstandard)
 
         Returns a dictionary containing:
         - success: True if results available
@@ -95,36 +120,117 @@ def register_results_tools(mcp):
             "downsampled": False
         }
         """
-        session_manager = get_session_manager()
-        system = session_manager.get_system(session_id)
+        session = SESSIONS.get_session(session_id)
 
-        if system is None:
+        if session is None:
             return {
                 "success": False,
                 "error": f"Session not found: {session_id}"
             }
 
-        try:
-            if not hasattr(system, 'TDS'):
-                return {
-                    "success": False,
-                    "error": "Time-domain simulation routine not available"
-                }
+        system = session.system
+
+        if not hasattr(system, 'TDS'):
+            return {
+                "success": False,
+                "error": "Time-domain simulation routine not available"
+            }
+
+        if max_points is None:
+            max_points = MAX_RESULT_POINTS
+
+        results = serialize_tds_results(system, variables=variables, max_points=max_points,
+                                        encoding=encoding, dtype=dtype,
+                                        var_index=session.get_var_index(),
+                                        downsample=downsample)
+        results["success"] = True
+
+        if compress:
+            compressed = compress_json(results)
+            if compressed is not None:
+                return {"success": True, **compressed}
+
+        return results
+
+    @mcp.tool()
+    @mcp_tool_safe("Error exporting TDS results")
+    def export_tds_results(
+        session_id: str,
+        path: str,
+        variables: Optional[List[str]] = None,
+        max_points: Optional[int] = None,
+        dtype: str = "float32",
+        downsample: str = "stride"
+    ) -> dict:
+        """
+        Write time-domain simulation results to a newline-delimited JSON file.
+
+        Variables are written one at a time, so long simulations can be exported
+        without building the whole response in memory. Existing files are not
+        overwritten.
+
+        Parameters:
+        - session_id: Session identifier from load_case
+        - path: Output file path on the server
+        - variables: Variable names to export (optional); all state variables if None
+        - max_points: Maximum number of data points (optional); no downsampling if None
+        - dtype: Value precision as in get_tds_results (default: "float32")
+        - downsample: "stride" (default) or "minmax", as in get_tds_results
+
+        The first line of the file holds the metadata returned by get_tds_results,
+        with the variable names in "variables". Each following line is
+        {"name": ..., "data": [...]} for one variable.
 
-            if max_points is None:
-                max_points = MCPConfig.MAX_RESULT_POINTS
+        Returns a dictionary containing:
+        - success: True if the file was written
+        - path: Absolute path of the written file
+        - n_variables: Number of variables written
+        - size: File size in bytes
 
-            results = serialize_tds_results(system, variables=variables, max_points=max_points)
-            results["success"] = True
-            return results
+        Example:
+        {
+            "success": True,
+            "path": "/tmp/kundur_tds.ndjson",
+            "n_variables": 52,
+            "size": 81234
+        }
+        """
+        session = SESSIONS.get_session(session_id)
+
+        if session is None:
+            return {
+                "success": False,
+                "error": f"Session not found: {session_id}"
+            }
 
-        except Exception as e:
+        if not session.system.TDS.initialized:
             return {
                 "success": False,
-                "error": f"Error retrieving TDS results: {str(e)}"
+                "error": "Time-domain simulation not initialized"
             }
 
+        lines = iter_tds_results(session.system, variables=variables, max_points=max_points,
+                                 dtype=dtype, var_index=session.get_var_index(),
+                                 downsample=downsample)
+        # Produce the metadata line first so invalid options fail before the file is created
+        meta = next(lines)
+        path = os.path.abspath(path)
+        n_variables = 0
+        with open(path, "xb") as f:
+            size = f.write(meta)
+            for line in lines:
+                size += f.write(line)
+                n_variables += 1
+
+        return {
+            "success": True,
+            "path": path,
+            "n_variables": n_variables,
+            "size": size,
+        }
+
     @mcp.tool()
+    @mcp_tool_safe("Error listing variables")
     def list_tds_variables(session_id: str) -> dict:
         """
         List all available variables from time-domain simulation.
@@ -148,32 +254,21 @@ def register_results_tools(mcp):
             "n_algebraic": 28
         }
         """
-        session_manager = get_session_manager()
-        system = session_manager.get_system(session_id)
+        session = SESSIONS.get_session(session_id)
 
-        if system is None:
+        if session is None:
             return {
                 "success": False,
                 "error": f"Session not found: {session_id}"
             }
 
-        try:
-            if not system.TDS.initialized:
-                return {
-                    "success": False,
-                    "error": "Time-domain simulation not initialized"
-                }
-
-            return {
-                "success": True,
-                "state_variables": system.dae.x_name,
-                "algebraic_variables": system.dae.y_name,
-                "n_states": len(system.dae.x_name),
-                "n_algebraic": len(system.dae.y_name),
-            }
-
-        except Exception as e:
+        if not session.system.TDS.initialized:
             return {
                 "success": False,
-                "error": f"Error listing variables: {str(e)}"
+                "error": "Time-domain simulation not initialized"
             }
+
+        return {
+            "success": True,
+            **session.get_var_names(),
+        }
@@ -1,7 +1,8 @@
+import os
 from typing import Optional
 import andes
 from ..config import MCPConfig
-from ..utils import get_session_manager, serialize_system_info
+from ..utils import CASE_TEMPLATES, SESSIONS, mcp_tool_safe
 
 
 def register_simulation_tools(mcp):
@@ -26,10 +27,11 @@ def register_simulation_tools(mcp):
         return {
             "cases": cases,
             "count": len(cases),
-            "cases_dir": str(MCPConfig.CASES_DIR),
+            "cases_dir": MCPConfig.CASES_DIR_STR,
         }
 
     @mcp.tool()
+    @mcp_tool_safe("Error loading case")
     def load_case(case_path: str, setup: bool = True, no_output: bool = True) -> dict:
         """
         Load an ANDES case file and create a new simulation session.
@@ -46,30 +48,33 @@ def register_simulation_tools(mcp):
 
         Example:
         {
-            "session_id": "abc-123-def-456",
+            "session_id": "Jx3kR9vQ2mZ8pL1wT5yN7A",
             "case_path": "ieee14/ieee14.xlsx",
             "system_info": {...}
         }
         """
-        import gc
-        from pathlib import Path
-
-        system = None
-
-        try:
+        if os.path.isabs(case_path):
+            # Absolute paths never refer to built-in cases
+            full_path = case_path
+        else:
             # Try to resolve as built-in case first
             full_path = MCPConfig.get_case_path(case_path)
             if full_path is None:
-                # Try as absolute path
+                # Fall back to a path relative to the working directory
                 full_path = case_path
 
-            # Validate that the file exists before attempting load
-            if not Path(full_path).exists():
-                return {
-                    "success": False,
-                    "error": f"Case file not found: {case_path}. Path resolved to: {full_path}"
-                }
+        # Validate that the file exists before attempting load
+        if not os.path.isfile(full_path):
+            return {
+                "success": False,
+                "error": f"Case file not found: {case_path}. Path resolved to: {full_path}"
+            }
+
+        # Reuse a previously loaded copy of the same case if available
+        template_key = (str(full_path), setup, no_output, os.stat(full_path).st_mtime_ns)
+        system = CASE_TEMPLATES.get(template_key)
 
+        if system is None:
             # Load the case
             system = andes.load(
                 str(full_path),
@@ -77,40 +82,28 @@ def register_simulation_tools(mcp):
                 no_output=no_output,
                 default_config=False,
             )
-
-            if system is None:
-                # Force garbage collection to clean up any partial state
-                gc.collect()
-                return {
-                    "success": False,
-                    "error": f"Failed to load case: {case_path}. The file may be corrupted or in an unsupported format."
-                }
-
-            # Create session
-            session_manager = get_session_manager()
-            session_id = session_manager.create_session(system, case_path)
-
-            return {
-                "success": True,
-                "session_id": session_id,
-                "case_path": case_path,
-                "system_info": serialize_system_info(system),
-            }
-
-        except Exception as e:
-            # Clean up the partial system if it was created
             if system is not None:
-                del system
-
-            # Force garbage collection to clean up any partial state
-            gc.collect()
+                CASE_TEMPLATES.put(template_key, system)
 
+        if system is None:
             return {
                 "success": False,
-                "error": f"Error loading case: {str(e)}"
+                "error": f"Failed to load case: {case_path}. The file may be corrupted or in an unsupported format."
             }
 
+        # Create session
+        session_id = SESSIONS.create_session(system, case_path)
+        session = SESSIONS.get_session(session_id)
+
+        return {
+            "success": True,
+            "session_id": session_id,
+            "case_path": case_path,
+            "system_info": session.get_system_info(),
+        }
+
     @mcp.tool()
+    @mcp_tool_safe("Error getting system info")
     def get_system_info(session_id: str) -> dict:
         """
         Get detailed information about a loaded system.
@@ -133,26 +126,19 @@ def register_simulation_tools(mcp):
             ...
         }
         """
-        session_manager = get_session_manager()
-        system = session_manager.get_system(session_id)
+        session = SESSIONS.get_session(session_id)
 
-        if system is None:
+        if session is None:
             return {
                 "success": False,
                 "error": f"Session not found: {session_id}"
             }
 
-        try:
-            return {
-                "success": True,
-                "session_id": session_id,
-                **serialize_system_info(system)
-            }
-        except Exception as e:
-            return {
-                "success": False,
-                "error": f"Error getting system info: {str(e)}"
-            }
+        return {
+            "success": True,
+            "session_id": session_id,
+            **session.get_system_info()
+        }
 
     @mcp.tool()
     def list_sessions() -> dict:
@@ -167,7 +153,7 @@ def register_simulation_tools(mcp):
         {
             "sessions": [
                 {
-                    "session_id": "abc-123",
+                    "session_id": "Jx3kR9vQ2mZ8pL1wT5yN7A",
                     "case_path": "ieee14/ieee14.xlsx",
                     "created_at": 1234567890.0,
                     "last_accessed": 1234567900.0
@@ -177,8 +163,7 @@ def register_simulation_tools(mcp):
             "count": 2
         }
         """
-        session_manager = get_session_manager()
-        sessions = session_manager.list_sessions()
+        sessions = SESSIONS.list_sessions()
 
         return {
             "success": True,
@@ -198,8 +183,7 @@ def register_simulation_tools(mcp):
         - success: True if session was closed, False otherwise
         - message: Status message
         """
-        session_manager = get_session_manager()
-        closed = session_manager.close_session(session_id)
+        closed = SESSIONS.close_session(session_id)
 
         if closed:
             return {
@@ -1,10 +1,22 @@
-from .session import SessionManager, get_session_manager
-from .serialization import serialize_system_info, serialize_pflow_results, serialize_tds_results
+from .decorators import mcp_tool_safe
+from .session import (CASE_TEMPLATES, SESSIONS, CaseTemplateCache, SessionManager,
+                      get_case_template_cache, get_session_manager)
+from .serialization import (serialize_system_info, serialize_pflow_results, serialize_tds_results,
+                            serialize_eig_results, iter_tds_results, to_json_bytes, compress_json)
 
 __all__ = [
+    "CASE_TEMPLATES",
+    "SESSIONS",
+    "CaseTemplateCache",
     "SessionManager",
+    "get_case_template_cache",
     "get_session_manager",
+    "mcp_tool_safe",
     "serialize_system_info",
     "serialize_pflow_results",
     "serialize_tds_results",
+    "serialize_eig_results",
+    "iter_tds_results",
+    "to_json_bytes",
+    "compress_json",
 ]
@@ -0,0 +1,30 @@
+import functools
+
+
+def mcp_tool_safe(error_prefix: str):
+    """
+    Decorator that turns exceptions raised by an MCP tool into an error response.
+
+    Parameters
+    ----------
+    error_prefix : str
+        Text placed before the exception message (e.g., "Error running power flow")
+
+    Returns
+    -------
+    Callable
+        Decorator returning ``{"success": False, "error": "<prefix>: <message>"}``
+        when the wrapped tool raises
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                return {
+                    "success": False,
+                    "error": f"{error_prefix}: {e}"
+                }
+        return wrapper
+    return decorator
@@ -1,13 +1,70 @@
+import base64
+import json
+import weakref
+
 import numpy as np
 import pandas as pd
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 from andes.system import System
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Options for all orjson encoding, combined once at import
+_ORJSON_OPT = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Supported encodings and binary dtypes for time-domain results
+TDS_ENCODINGS = ("json", "binary", "arrow")
+BINARY_DTYPES = ("float16", "float32", "float64")
+# JSON payloads smaller than this are not worth compressing
+ZSTD_MIN_SIZE = 64 * 1024
+# Significant digits kept in JSON output for reduced-precision dtypes
+JSON_DIGITS = {"float16": 4, "float32": 7}
+DOWNSAMPLE_METHODS = ("stride", "minmax")
+
+# Types returned unchanged by `numpy_to_python`
+_PLAIN_TYPES = frozenset((str, int, float, bool, type(None)))
+
+# Conversions by exact type used by `numpy_to_python` before isinstance checks
+_CONVERTERS = {
+    np.ndarray: np.ndarray.tolist,
+    np.bool_: bool,
+    **{t: np.generic.item for t in (
+        np.int8, np.int16, np.int32, np.int64,
+        np.uint8, np.uint16, np.uint32, np.uint64,
+        np.float16, np.float32, np.float64,
+    )},
+}
+
+# Variable lookups per DAE object as {dae: ((n, m), var_index)}
+_var_index_cache = weakref.WeakKeyDictionary()
+
+# Models whose outputs are reported as generator results
+GEN_MODELS = ("Slack", "PV", "PQ")
+
+# Bus name strings per Bus model as {bus: (names, n, name_strings)}
+_bus_name_cache = weakref.WeakKeyDictionary()
+
 
 def numpy_to_python(obj: Any) -> Any:
     """
     Convert numpy types to Python native types for JSON serialization.
 
+    Nested dicts, lists and tuples are converted with an explicit stack, so
+    deep nesting is not limited by the recursion limit. Tuples become lists.
+
     Parameters
     ----------
     obj : Any
@@ -18,17 +75,390 @@ def numpy_to_python(obj: Any) -> Any:
     Any
         Python native type
     """
+    convert = _CONVERTERS.get(type(obj))
+    if convert is not None:
+        return convert(obj)
+
+    root = [None]
+    # Pending conversions as (container, key, value); the result of each
+    # is stored as container[key]
+    stack = [(root, 0, obj)]
+    while stack:
+        parent, key, item = stack.pop()
+        cls = type(item)
+        convert = _CONVERTERS.get(cls)
+        if convert is not None:
+            new = convert(item)
+        elif cls is dict or (cls is not list and isinstance(item, dict)):
+            new = {}
+            for k, v in item.items():
+                new[k] = v
+                if type(v) not in _PLAIN_TYPES:
+                    stack.append((new, k, v))
+        elif cls is list or isinstance(item, (list, tuple)):
+            new = list(item)
+            stack.extend((new, i, v) for i, v in enumerate(item) if type(v) not in _PLAIN_TYPES)
+        elif isinstance(item, np.ndarray):
+            new = item.tolist()
+        elif isinstance(item, (np.integer, np.floating)):
+            new = item.item()
+        elif isinstance(item, np.bool_):
+            new = bool(item)
+        else:
+            new = item
+        parent[key] = new
+    return root[0]
+
+
+def _default(obj: Any) -> Any:
+    """
+    Convert objects orjson cannot encode natively, such as non-contiguous
+    arrays and arrays or scalars of unsupported numpy types.
+    """
     if isinstance(obj, np.ndarray):
         return obj.tolist()
-    elif isinstance(obj, (np.integer, np.floating)):
+    if isinstance(obj, np.generic):
         return obj.item()
-    elif isinstance(obj, np.bool_):
-        return bool(obj)
-    elif isinstance(obj, dict):
-        return {k: numpy_to_python(v) for k, v in obj.items()}
-    elif isinstance(obj, (list, tuple)):
-        return [numpy_to_python(item) for item in obj]
-    return obj
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def to_json_bytes(obj: Any) -> bytes:
+    """
+    Encode an object as JSON bytes, serializing numpy arrays and scalars directly.
+
+    Uses ``orjson`` when installed, which walks numpy arrays in compiled code.
+    Falls back to the standard library with `numpy_to_python` otherwise.
+
+    Parameters
+    ----------
+    obj : Any
+        Object to encode; may contain numpy arrays and scalars
+
+    Returns
+    -------
+    bytes
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPT)
+    return json.dumps(numpy_to_python(obj)).encode('utf-8')
+
+
+def compress_json(obj: Any, level: int = 3, min_size: int = ZSTD_MIN_SIZE) -> Optional[dict]:
+    """
+    Encode an object as JSON and compress it with zstd.
+
+    Parameters
+    ----------
+    obj : Any
+        Object to encode, as accepted by `to_json_bytes`
+    level : int
+        zstd compression level
+    min_size : int
+        Smallest JSON size in bytes that is compressed
+
+    Returns
+    -------
+    Optional[dict]
+        Dictionary with "compression", "size" (uncompressed bytes) and base64
+        "data" fields, or None if the JSON is smaller than ``min_size``
+    """
+    if zstandard is None:
+        raise ImportError("zstandard is required for compression")
+
+    blob = to_json_bytes(obj)
+    if len(blob) < min_size:
+        return None
+    return {
+        "compression": "zstd",
+        "size": len(blob),
+        "data": base64.b64encode(zstandard.ZstdCompressor(level=level).compress(blob)).decode('ascii'),
+    }
+
+
+def encode_array(arr: np.ndarray, dtype: str = "float32") -> dict:
+    """
+    Encode a 1-D numeric array as base64-packed little-endian binary.
+
+    Parameters
+    ----------
+    arr : np.ndarray
+        Array to encode
+    dtype : str
+        Target floating-point type, one of "float16", "float32" or "float64"
+
+    Returns
+    -------
+    dict
+        Dictionary with "dtype", "shape" and base64 "data" fields
+    """
+    if dtype not in BINARY_DTYPES:
+        raise ValueError(f"Unsupported dtype: {dtype}. Use one of {', '.join(BINARY_DTYPES)}")
+
+    data = np.ascontiguousarray(arr, dtype=np.dtype(dtype).newbyteorder('<'))
+    return {
+        "dtype": dtype,
+        "shape": list(data.shape),
+        "data": base64.b64encode(data.tobytes()).decode('ascii'),
+    }
+
+
+def encode_arrow(columns: Dict[str, np.ndarray], dtype: str = "float32") -> str:
+    """
+    Encode named 1-D arrays of equal length as a base64 Arrow IPC stream.
+
+    Parameters
+    ----------
+    columns : Dict[str, np.ndarray]
+        Arrays keyed by column name, in column order
+    dtype : str
+        Target floating-point type, one of "float16", "float32" or "float64"
+
+    Returns
+    -------
+    str
+        Base64 of an Arrow IPC stream holding a single record batch
+    """
+    if pa is None:
+        raise ImportError("pyarrow is required for Arrow encoding")
+    if dtype not in BINARY_DTYPES:
+        raise ValueError(f"Unsupported dtype: {dtype}. Use one of {', '.join(BINARY_DTYPES)}")
+
+    batch = pa.record_batch(
+        [pa.array(np.ascontiguousarray(col, dtype=dtype)) for col in columns.values()],
+        names=list(columns),
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, batch.schema) as writer:
+        writer.write_batch(batch)
+    return base64.b64encode(sink.getvalue()).decode('ascii')
+
+
+def round_significant(arr: np.ndarray, digits: int) -> np.ndarray:
+    """
+    Round values to a number of significant digits.
+
+    Rounded values have short decimal representations, which shrinks JSON
+    output compared to full float64 values.
+
+    Parameters
+    ----------
+    arr : np.ndarray
+        Array to round
+    digits : int
+        Number of significant digits to keep
+
+    Returns
+    -------
+    np.ndarray
+        Rounded float64 array; zeros, non-finite values and values too small
+        or too large for a finite scale factor (such as subnormals) are
+        unchanged
+    """
+    arr = np.asarray(arr, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        mag = np.floor(np.log10(np.abs(arr)))
+        mag[~np.isfinite(mag)] = 0
+        exponent = digits - 1 - mag
+        # Keep the powers of ten finite; clipped values are left as is
+        exponent = np.clip(exponent, -301, 301)
+        in_range = np.abs(exponent) <= 300
+        # Scale by an exact power of ten in either direction, so that
+        # values such as 1.235e8 come out exactly
+        up = 10.0 ** np.maximum(exponent, 0)
+        down = 10.0 ** np.maximum(-exponent, 0)
+        out = np.round(arr * up / down) * down / up
+    return np.where(in_range & np.isfinite(out), out, arr)
+
+
+def _json_values(arr: np.ndarray, dtype: str) -> list:
+    """
+    Convert an array to lists, rounded to the precision of `dtype`.
+    """
+    digits = JSON_DIGITS.get(dtype)
+    if digits is not None:
+        arr = round_significant(arr, digits)
+    return arr.tolist()
+
+
+def _encode_columns(block: np.ndarray, encoding: str, dtype: str) -> list:
+    """
+    Convert each column of a 2-D (time, variable) block for output.
+
+    Columns are left as arrays for "arrow", which encodes them together.
+    """
+    if encoding == "binary":
+        return [encode_array(col, dtype) for col in block.T]
+    if encoding == "arrow":
+        return list(block.T)
+    return _json_values(block.T, dtype)
+
+
+def build_var_index(dae) -> Dict[str, tuple]:
+    """
+    Build a lookup table from DAE variable names to their arrays and columns.
+
+    Parameters
+    ----------
+    dae : DAE
+        DAE object of an ANDES System
+
+    Returns
+    -------
+    Dict[str, tuple]
+        Mapping from variable name to ("x", index) for states or
+        ("y", index) for algebraic variables
+    """
+    var_index = {name: ('y', i) for i, name in enumerate(dae.y_name)}
+    # State variables take precedence on name clashes
+    var_index.update({name: ('x', i) for i, name in enumerate(dae.x_name)})
+    return var_index
+
+
+def _minmax_downsample(block: np.ndarray, bucket: int) -> np.ndarray:
+    """
+    Reduce each column of a 2-D (time, variable) block to the minimum and
+    maximum over consecutive buckets of rows.
+
+    Returns two rows per bucket. Within a bucket, the extremum that occurs
+    first in time comes first.
+    """
+    n_rows, n_cols = block.shape
+    n_buckets = -(-n_rows // bucket)
+    pad = n_buckets * bucket - n_rows
+    if pad:
+        # Repeat the last row so padding never changes a bucket's extrema
+        block = np.pad(block, ((0, pad), (0, 0)), mode='edge')
+
+    blocks = block.reshape(n_buckets, bucket, n_cols)
+    i_min = blocks.argmin(axis=1)
+    i_max = blocks.argmax(axis=1)
+    v_min = np.take_along_axis(blocks, i_min[:, np.newaxis, :], axis=1)[:, 0, :]
+    v_max = np.take_along_axis(blocks, i_max[:, np.newaxis, :], axis=1)[:, 0, :]
+    min_first = i_min <= i_max
+
+    out = np.empty((2 * n_buckets, n_cols), dtype=block.dtype)
+    out[0::2] = np.where(min_first, v_min, v_max)
+    out[1::2] = np.where(min_first, v_max, v_min)
+    return out
+
+
+def _minmax_time(t: np.ndarray, bucket: int) -> np.ndarray:
+    """
+    Time stamps matching `_minmax_downsample`: the first and last time of each bucket.
+    """
+    starts = np.arange(0, len(t), bucket)
+    ends = np.minimum(starts + bucket, len(t)) - 1
+    out = np.empty(2 * len(starts), dtype=t.dtype)
+    out[0::2] = t[starts]
+    out[1::2] = t[ends]
+    return out
+
+
+def _sample_rows(arr: np.ndarray, cols, step: int, bucket: int) -> np.ndarray:
+    """
+    Select columns of a 2-D time series and downsample its rows.
+
+    Uses min-max buckets of ``bucket`` rows if ``bucket`` is nonzero, and a
+    stride of ``step`` rows otherwise. Contiguous rows are gathered with
+    `np.take`, which copies whole rows at a time and is about twice as fast
+    as fancy indexing; strided rows use fancy indexing, which is faster there.
+    """
+    if bucket:
+        return _minmax_downsample(arr if cols is None else np.take(arr, cols, axis=1), bucket)
+    if cols is None:
+        return arr[::step]
+    if step == 1:
+        return np.take(arr, cols, axis=1)
+    return arr[::step, cols]
+
+
+def _plan_sampling(t: np.ndarray, max_points: Optional[int], downsample: str) -> tuple:
+    """
+    Choose how time-domain rows are downsampled.
+
+    Returns ``(downsampled, step, bucket, time_array)`` for use with `_sample_rows`.
+    Min-max buckets need two points each, so "minmax" falls back to a stride
+    when ``max_points`` is below 2.
+    """
+    n_points = len(t)
+    downsampled = bool(max_points) and n_points > max_points
+
+    # Downsampling is shared by time and all variables
+    step, bucket = 1, 0
+    if downsampled and downsample == "minmax" and max_points >= 2:
+        bucket = -(-n_points // (max_points // 2))
+        time_array = _minmax_time(t, bucket)
+    else:
+        if downsampled:
+            step = n_points // max_points
+        time_array = t[::step]
+    return downsampled, step, bucket, time_array
+
+
+def _resolve_columns(variables: List[str], var_index: Dict[str, tuple]) -> tuple:
+    """
+    Split requested variable names into state and algebraic columns.
+
+    Returns ``(x_names, x_cols, y_names, y_cols)``. Unknown names are skipped.
+    """
+    x_names, x_cols, y_names, y_cols = [], [], [], []
+    for var_name in variables:
+        loc = var_index.get(var_name)
+        if loc is None:
+            continue
+        kind, col = loc
+        if kind == 'x':
+            x_names.append(var_name)
+            x_cols.append(col)
+        else:
+            y_names.append(var_name)
+            y_cols.append(col)
+    return x_names, x_cols, y_names, y_cols
+
+
+def get_var_index(dae) -> Dict[str, tuple]:
+    """
+    Get the variable lookup for a DAE, cached until its sizes change.
+
+    Parameters
+    ----------
+    dae : DAE
+        DAE object of an ANDES System
+
+    Returns
+    -------
+    Dict[str, tuple]
+        Variable lookup as returned by `build_var_index`
+    """
+    key = (dae.n, dae.m)
+    cached = _var_index_cache.get(dae)
+    if cached is None or cached[0] != key:
+        cached = (key, build_var_index(dae))
+        _var_index_cache[dae] = cached
+    return cached[1]
+
+
+def get_bus_names(bus) -> List[str]:
+    """
+    Get the Bus names as strings, cached until the name list changes.
+
+    Parameters
+    ----------
+    bus : Bus
+        Bus model of an ANDES System
+
+    Returns
+    -------
+    List[str]
+        Bus names converted with `str`
+    """
+    names = bus.name.v
+    cached = _bus_name_cache.get(bus)
+    if cached is None or cached[0] is not names or cached[1] != len(names):
+        cached = (names, len(names), [str(n) for n in names])
+        _bus_name_cache[bus] = cached
+    return cached[2]
 
 
 def serialize_system_info(system: System) -> dict:
@@ -72,7 +502,37 @@ def serialize_system_info(system: System) -> dict:
     return info
 
 
-def serialize_pflow_results(system: System) -> dict:
+def resolve_gen_models(system: System) -> List[tuple]:
+    """
+    Find the generator models of a system and their power output attributes.
+
+    Parameters
+    ----------
+    system : System
+        ANDES System object
+
+    Returns
+    -------
+    List[tuple]
+        ``(model, p, q)`` for each model in `GEN_MODELS` with devices, where
+        ``p`` and ``q`` are the model's output variables, or None if missing
+    """
+    gen_models = []
+    for model_name in GEN_MODELS:
+        model = getattr(system, model_name, None)
+        if model is None or getattr(model, 'n', 0) == 0:
+            continue
+        p = getattr(model, 'p', None)
+        q = getattr(model, 'q', None)
+        gen_models.append((
+            model,
+            p if hasattr(p, 'v') else None,
+            q if hasattr(q, 'v') else None,
+        ))
+    return gen_models
+
+
+def serialize_pflow_results(system: System, gen_models: Optional[List[tuple]] = None) -> dict:
     """
     Serialize power flow results.
 
@@ -80,6 +540,9 @@ def serialize_pflow_results(system: System) -> dict:
     ----------
     system : System
         ANDES System object with completed power flow
+    gen_models : List[tuple], optional
+        Generator models as returned by `resolve_gen_models`, resolved from
+        `system` if not provided
 
     Returns
     -------
@@ -105,33 +568,34 @@ def serialize_pflow_results(system: System) -> dict:
     if hasattr(system, 'Bus') and system.Bus.n > 0:
         results["buses"] = {
             "idx": numpy_to_python(system.Bus.idx.v),
-            "name": [str(n) for n in system.Bus.name.v] if hasattr(system.Bus, 'name') else [],
-            "voltage": numpy_to_python(system.Bus.v.v),
-            "angle": numpy_to_python(system.Bus.a.v),
+            "name": get_bus_names(system.Bus) if hasattr(system.Bus, 'name') else [],
+            "voltage": system.Bus.v.v.tolist(),
+            "angle": system.Bus.a.v.tolist(),
         }
 
     # Generator results if available
     # StaticGen is a group, so we need to collect from individual generator models
+    # Collect the arrays first and convert each output once
+    if gen_models is None:
+        gen_models = resolve_gen_models(system)
+
     gen_idx = []
     gen_p = []
     gen_q = []
 
-    for model_name in ['Slack', 'PV', 'PQ']:
-        if hasattr(system, model_name):
-            model = getattr(system, model_name)
-            if hasattr(model, 'n') and model.n > 0:
-                if hasattr(model, 'idx') and hasattr(model.idx, 'v'):
-                    gen_idx.extend(numpy_to_python(model.idx.v))
-                if hasattr(model, 'p') and hasattr(model.p, 'v'):
-                    gen_p.extend(numpy_to_python(model.p.v))
-                if hasattr(model, 'q') and hasattr(model.q, 'v'):
-                    gen_q.extend(numpy_to_python(model.q.v))
+    for model, p, q in gen_models:
+        gen_idx.extend(model.idx.v)
+        if p is not None:
+            gen_p.append(p.v)
+        if q is not None:
+            gen_q.append(q.v)
 
     if gen_idx:
         results["generators"] = {
-            "idx": gen_idx,
-            "p": gen_p,
-            "q": gen_q,
+            # idx values may mix int and str, so they are not merged with numpy
+            "idx": numpy_to_python(gen_idx),
+            "p": np.concatenate(gen_p).tolist() if gen_p else [],
+            "q": np.concatenate(gen_q).tolist() if gen_q else [],
         }
 
     return results
@@ -140,7 +604,11 @@ def serialize_pflow_results(system: System) -> dict:
 def serialize_tds_results(
     system: System,
     variables: Optional[List[str]] = None,
-    max_points: Optional[int] = None
+    max_points: Optional[int] = None,
+    encoding: str = "json",
+    dtype: str = "float32",
+    var_index: Optional[Dict[str, tuple]] = None,
+    downsample: str = "stride",
 ) -> dict:
     """
     Serialize time-domain simulation results.
@@ -153,6 +621,25 @@ def serialize_tds_results(
         Specific variable names to return. If None, returns all.
     max_points : Optional[int]
         Maximum number of data points to return (downsampling if needed)
+    encoding : str
+        "json" for lists of floats, "binary" for base64-packed arrays (see
+        `encode_array`), or "arrow" for a single base64 Arrow IPC stream (see
+        `encode_arrow`). With "arrow", "variables" lists the variable names and
+        "data" holds the stream, with time as the first column "time".
+    dtype : str
+        Floating-point type of binary and Arrow encoded arrays. For "json",
+        values are rounded to the significant digits of the type (see
+        `JSON_DIGITS`); use "float64" for full precision.
+    var_index : Optional[Dict[str, tuple]]
+        Prebuilt variable lookup from `build_var_index`. Taken from the
+        per-DAE cache in `get_var_index` if not provided.
+    downsample : str
+        How to reduce series longer than ``max_points``. "stride" keeps every
+        n-th point. "minmax" keeps the minimum and maximum of each bucket of
+        points, which preserves peaks. The time stamps of a bucket's two points
+        are the first and last times of the bucket, not the times at which the
+        extrema occurred, so a peak may be shifted by up to one bucket. Falls
+        back to "stride" if ``max_points`` is below 2.
 
     Returns
     -------
@@ -165,63 +652,153 @@ def serialize_tds_results(
             "error": "Time-domain simulation not initialized"
         }
 
-    dae = system.dae
+    if encoding not in TDS_ENCODINGS:
+        raise ValueError(f"Unsupported encoding: {encoding}. Use one of {', '.join(TDS_ENCODINGS)}")
+    if encoding == "arrow" and pa is None:
+        raise ImportError("pyarrow is required for Arrow encoding")
+    if dtype not in BINARY_DTYPES:
+        raise ValueError(f"Unsupported dtype: {dtype}. Use one of {', '.join(BINARY_DTYPES)}")
+    if downsample not in DOWNSAMPLE_METHODS:
+        raise ValueError(f"Unsupported downsample method: {downsample}. "
+                         f"Use one of {', '.join(DOWNSAMPLE_METHODS)}")
 
-    # Get time array
-    time_array = numpy_to_python(dae.ts.t)
+    dae = system.dae
+    ts = dae.ts
+    n_points = len(ts.t)
+    downsampled, step, bucket, time_array = _plan_sampling(ts.t, max_points, downsample)
 
     results = {
         "initialized": True,
         "converged": not system.TDS.busted,
         "exec_time": float(system.TDS.exec_time) if hasattr(system.TDS, 'exec_time') else None,
-        "time": time_array,
-        "n_points": len(time_array),
+        "time": (encode_array(time_array, dtype) if encoding == "binary"
+                 else time_array if encoding == "arrow" else _json_values(time_array, dtype)),
+        "n_points": n_points,
         "variables": {},
+        "downsampled": downsampled,
+        "encoding": encoding,
     }
+    if downsampled:
+        results["downsample_method"] = "minmax" if bucket else "stride"
+        results["downsample_factor"] = bucket or step
 
     # Determine which variables to include
     if variables is None:
         # Include all state variables
-        var_names = dae.x_name
-        var_data = dae.ts.x
-    else:
-        # Filter requested variables
-        var_names = []
-        var_data = []
-        for var_name in variables:
-            if var_name in dae.x_name:
-                idx = dae.x_name.index(var_name)
-                var_names.append(var_name)
-                var_data.append(dae.ts.x[:, idx])
-            elif var_name in dae.y_name:
-                idx = dae.y_name.index(var_name)
-                var_names.append(var_name)
-                var_data.append(dae.ts.y[:, idx])
-
-    # Apply downsampling if needed
-    if max_points and len(time_array) > max_points:
-        step = len(time_array) // max_points
-        results["time"] = time_array[::step]
-        results["downsampled"] = True
-        results["downsample_factor"] = step
+        data = _sample_rows(ts.x, None, step, bucket)
+        results["variables"] = dict(zip(dae.x_name, _encode_columns(data, encoding, dtype)))
     else:
-        results["downsampled"] = False
+        # Resolve requested names to columns and slice each array once
+        if var_index is None:
+            var_index = get_var_index(dae)
 
-    # Add variable data
-    for i, name in enumerate(var_names):
-        if isinstance(var_data, list):
-            data = var_data[i]
-        else:
-            data = var_data[:, i] if len(var_data.shape) > 1 else var_data
+        x_names, x_cols, y_names, y_cols = _resolve_columns(variables, var_index)
+
+        x_data = _sample_rows(ts.x, x_cols, step, bucket)
+        y_data = _sample_rows(ts.y, y_cols, step, bucket)
+        var_data = dict(zip(x_names, _encode_columns(x_data, encoding, dtype)))
+        var_data.update(zip(y_names, _encode_columns(y_data, encoding, dtype)))
 
-        if results.get("downsampled"):
-            data = data[::results["downsample_factor"]]
+        # Keep the requested order
+        results["variables"] = {name: var_data[name] for name in variables if name in var_data}
 
-        results["variables"][name] = numpy_to_python(data)
+    if encoding == "arrow":
+        columns = {"time": results.pop("time"), **results["variables"]}
+        results["variables"] = list(results["variables"])
+        results["data"] = encode_arrow(columns, dtype)
 
     return results
 
 
+def iter_tds_results(
+    system: System,
+    variables: Optional[List[str]] = None,
+    max_points: Optional[int] = None,
+    dtype: str = "float32",
+    var_index: Optional[Dict[str, tuple]] = None,
+    downsample: str = "stride",
+) -> Iterator[bytes]:
+    """
+    Stream time-domain simulation results as newline-delimited JSON.
+
+    The first line holds the same metadata as `serialize_tds_results` with
+    JSON encoding, including "time", and the variable names in "variables".
+    Each following line is ``{"name": ..., "data": [...]}`` for one variable,
+    which is sampled and encoded only when the line is produced, so the
+    converted values of only one variable are held at a time.
+
+    Parameters
+    ----------
+    system : System
+        ANDES System object with completed TDS
+    variables : Optional[List[str]]
+        Specific variable names to return. If None, returns all state variables.
+    max_points : Optional[int]
+        Maximum number of data points to return (downsampling if needed)
+    dtype : str
+        Precision of the values, as for JSON in `serialize_tds_results`
+    var_index : Optional[Dict[str, tuple]]
+        Prebuilt variable lookup from `build_var_index`
+    downsample : str
+        "stride" or "minmax", as in `serialize_tds_results`
+
+    Yields
+    ------
+    bytes
+        One JSON document per line, each ending with a newline
+    """
+    if not system.TDS.initialized:
+        yield to_json_bytes({
+            "initialized": False,
+            "error": "Time-domain simulation not initialized"
+        }) + b"\n"
+        return
+
+    if dtype not in BINARY_DTYPES:
+        raise ValueError(f"Unsupported dtype: {dtype}. Use one of {', '.join(BINARY_DTYPES)}")
+    if downsample not in DOWNSAMPLE_METHODS:
+        raise ValueError(f"Unsupported downsample method: {downsample}. "
+                         f"Use one of {', '.join(DOWNSAMPLE_METHODS)}")
+
+    dae = system.dae
+    ts = dae.ts
+    downsampled, step, bucket, time_array = _plan_sampling(ts.t, max_points, downsample)
+    digits = JSON_DIGITS.get(dtype)
+
+    if variables is None:
+        columns = [(name, ts.x, col) for col, name in enumerate(dae.x_name)]
+    else:
+        if var_index is None:
+            var_index = get_var_index(dae)
+        columns = []
+        for name in variables:
+            loc = var_index.get(name)
+            if loc is not None:
+                columns.append((name, ts.x if loc[0] == 'x' else ts.y, loc[1]))
+
+    meta = {
+        "initialized": True,
+        "converged": not system.TDS.busted,
+        "exec_time": float(system.TDS.exec_time) if hasattr(system.TDS, 'exec_time') else None,
+        "time": round_significant(time_array, digits) if digits else time_array,
+        "n_points": len(ts.t),
+        "variables": [name for name, _, _ in columns],
+        "downsampled": downsampled,
+        "encoding": "json",
+    }
+    if downsampled:
+        meta["downsample_method"] = "minmax" if bucket else "stride"
+        meta["downsample_factor"] = bucket or step
+    yield to_json_bytes(meta) + b"\n"
+    del meta
+
+    for name, arr, col in columns:
+        data = _sample_rows(arr, [col], step, bucket)[:, 0]
+        if digits:
+            data = round_significant(data, digits)
+        yield to_json_bytes({"name": name, "data": data}) + b"\n"
+
+
 def serialize_eig_results(system: System) -> dict:
     """
     Serialize eigenvalue analysis results.
@@ -254,8 +831,8 @@ def serialize_eig_results(system: System) -> dict:
     results = {
         "n_eigenvalues": len(eig.mu),
         "eigenvalues": {
-            "real": numpy_to_python(np.real(eig.mu)),
-            "imag": numpy_to_python(np.imag(eig.mu)),
+            "real": np.real(eig.mu).tolist(),
+            "imag": np.imag(eig.mu).tolist(),
         },
         "statistics": {
             "n_positive": int(eig.n_positive),
@@ -266,7 +843,7 @@ def serialize_eig_results(system: System) -> dict:
 
     # Add participation factors if available
     if eig.pfactors is not None:
-        results["participation_factors"] = numpy_to_python(eig.pfactors)
+        results["participation_factors"] = np.asarray(eig.pfactors).tolist()
 
     # Add state names if available
     if eig.x_name is not None and len(eig.x_name) > 0:
@@ -1,7 +1,43 @@
+import copy
+import heapq
+import secrets
+import threading
 import time
-import uuid
-from typing import Dict, Optional
+import weakref
+from collections import OrderedDict
+from typing import Hashable, List, Optional, Tuple
 from andes.system import System
+from ..config import MCPConfig
+from .serialization import get_var_index, resolve_gen_models, serialize_system_info
+
+# Number of independently locked session shards, must be a power of two
+N_SHARDS = 16
+
+# Clock for session expiry, unaffected by wall-clock changes
+_now = time.monotonic
+# Offset converting `_now` readings to wall-clock timestamps for display
+_WALL_OFFSET = time.time() - _now()
+
+# Smallest expiry heap that is compacted when mostly stale
+MIN_HEAP_COMPACT = 32
+
+# Shortest interval in seconds between background expiry sweeps
+MIN_SWEEP_INTERVAL = 1.0
+
+
+def _sweep_loop(manager_ref: weakref.ref, stop: threading.Event, interval: float):
+    """
+    Remove expired sessions every `interval` seconds until `stop` is set.
+
+    Holds only a weak reference between sweeps, so the loop ends when the
+    manager is garbage collected.
+    """
+    while not stop.wait(interval):
+        manager = manager_ref()
+        if manager is None:
+            return
+        manager._cleanup_expired()
+        del manager
 
 
 class Session:
@@ -9,33 +45,159 @@ class Session:
     Represents a single ANDES simulation session.
     """
 
-    def __init__(self, session_id: str, system: System, case_path: str):
+    def __init__(self, session_id: str, system: System, case_path: str, timeout: float = 3600):
         self.session_id = session_id
         self.system = system
         self.case_path = case_path
-        self.created_at = time.time()
-        self.last_accessed = time.time()
-        self.metadata = {}
+        self.timeout = timeout
+        self.created_at = _now()
+        self.last_accessed = self.created_at
+        self.expires_at = self.last_accessed + timeout
+        # Summary returned by `SessionManager.list_sessions`, updated in place
+        self.metadata = {
+            "session_id": session_id,
+            "case_path": case_path,
+            "created_at": self.created_at + _WALL_OFFSET,
+            "last_accessed": self.last_accessed + _WALL_OFFSET,
+        }
+        # (fingerprint, info) cached by `get_system_info`
+        self._info_cache = None
+        self._var_key = None
+        self._var_names = None
+        # Generator models for power flow results, as from `resolve_gen_models`
+        self.gen_models = resolve_gen_models(system)
+
+    def touch(self, now: Optional[float] = None):
+        """Update last accessed timestamp and expiry time"""
+        if now is None:
+            now = _now()
+        self.last_accessed = now
+        self.expires_at = now + self.timeout
+        self.metadata["last_accessed"] = now + _WALL_OFFSET
 
-    def touch(self):
-        """Update last accessed timestamp"""
-        self.last_accessed = time.time()
+    def is_expired(self, now: float) -> bool:
+        """Check if session has expired at time `now` from `_now`"""
+        return now > self.expires_at
 
-    def is_expired(self, timeout: int) -> bool:
-        """Check if session has expired"""
-        return (time.time() - self.last_accessed) > timeout
+    def get_system_info(self) -> dict:
+        """
+        Get the serialized system information, rebuilt only when the system changes.
+
+        The cached result is reused until the system's setup state, DAE sizes,
+        simulation time or case file change.
+
+        Returns
+        -------
+        dict
+            System information as returned by `serialize_system_info`
+        """
+        system = self.system
+        dae = system.dae
+        # dae.t is a 0-d array updated in place, so store its value
+        fingerprint = (system.is_setup, dae.n, dae.m, float(dae.t), str(system.files.case))
+        if self._info_cache is None or self._info_cache[0] != fingerprint:
+            self._info_cache = (fingerprint, serialize_system_info(system))
+        return self._info_cache[1]
+
+    def _refresh_var_cache(self):
+        """Rebuild the cached DAE variable names if the DAE sizes changed"""
+        dae = self.system.dae
+        key = (dae.n, dae.m)
+        if self._var_key == key:
+            return
+        self._var_names = {
+            "state_variables": tuple(dae.x_name),
+            "algebraic_variables": tuple(dae.y_name),
+            "n_states": len(dae.x_name),
+            "n_algebraic": len(dae.y_name),
+        }
+        self._var_key = key
+
+    def get_var_index(self) -> dict:
+        """
+        Get the DAE variable name lookup, rebuilt only when the DAE sizes change.
+
+        Returns
+        -------
+        dict
+            Variable lookup from the per-DAE cache in `get_var_index`
+        """
+        return get_var_index(self.system.dae)
+
+    def get_var_names(self) -> dict:
+        """
+        Get the DAE variable names, rebuilt only when the DAE sizes change.
+
+        Returns
+        -------
+        dict
+            State and algebraic variable names as tuples, and their counts
+        """
+        self._refresh_var_cache()
+        return self._var_names
 
 
 class SessionManager:
     """
     Manages multiple ANDES System instances with session lifecycle.
+
+    Sessions are spread over `N_SHARDS` dictionaries, each guarded by its own
+    lock, so concurrent requests for different sessions rarely contend. Each
+    shard is an `OrderedDict` kept in access order, with the least recently
+    used session first. Expired sessions are removed by a background thread,
+    started with the first session, which sweeps every quarter of the
+    timeout. Expiry times are tracked in a heap so each sweep only visits
+    sessions that may have expired.
     """
 
     def __init__(self, max_sessions: int = 100, timeout: int = 3600):
-        self.sessions: Dict[str, Session] = {}
+        self._shards: List[Tuple[threading.Lock, OrderedDict]] = [
+            (threading.Lock(), OrderedDict()) for _ in range(N_SHARDS)
+        ]
+        self._count = 0
+        self._count_lock = threading.Lock()
+        self._create_lock = threading.Lock()
+        # Heap of (expiry time, session ID), may hold stale entries
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._heap_lock = threading.Lock()
+        self._sweeper: Optional[threading.Thread] = None
+        self._stop_sweeper = threading.Event()
         self.max_sessions = max_sessions
         self.timeout = timeout
 
+    def __len__(self) -> int:
+        return self._count
+
+    def _get_shard(self, session_id: str) -> Tuple[threading.Lock, OrderedDict]:
+        """Get the lock and dictionary holding a session ID"""
+        return self._shards[hash(session_id) & (N_SHARDS - 1)]
+
+    def _add_count(self, delta: int):
+        """Update the number of live sessions"""
+        with self._count_lock:
+            self._count += delta
+
+    def _start_sweeper(self):
+        """Start the background expiry sweep if it is not running"""
+        if self._sweeper is not None:
+            if self._sweeper.is_alive() and not self._stop_sweeper.is_set():
+                return
+            # A stopped sweep exits promptly once its event is set
+            self._sweeper.join()
+        self._stop_sweeper.clear()
+        interval = max(self.timeout / 4, MIN_SWEEP_INTERVAL)
+        self._sweeper = threading.Thread(
+            target=_sweep_loop,
+            args=(weakref.ref(self), self._stop_sweeper, interval),
+            name="andes-mcp-session-sweeper",
+            daemon=True,
+        )
+        self._sweeper.start()
+
+    def stop_sweeper(self):
+        """Stop the background expiry sweep; it restarts with the next new session"""
+        self._stop_sweeper.set()
+
     def create_session(self, system: System, case_path: str) -> str:
         """
         Create a new session with an ANDES System instance.
@@ -52,20 +214,26 @@ class SessionManager:
         str
             Unique session ID
         """
-        # Clean up expired sessions before creating new one
-        self._cleanup_expired()
+        with self._create_lock:
+            self._start_sweeper()
 
-        # Enforce max sessions limit
-        if len(self.sessions) >= self.max_sessions:
-            # Remove oldest session
-            oldest_id = min(self.sessions.keys(),
-                            key=lambda k: self.sessions[k].last_accessed)
-            del self.sessions[oldest_id]
+            # Enforce max sessions limit, which may count expired sessions
+            # not yet swept; they are the least recently used and go first
+            while self._count >= self.max_sessions:
+                if not self._evict_oldest():
+                    break
 
-        # Generate unique session ID
-        session_id = str(uuid.uuid4())
-        session = Session(session_id, system, case_path)
-        self.sessions[session_id] = session
+            # Generate unique session ID
+            session_id = secrets.token_urlsafe(16)
+            session = Session(session_id, system, case_path, self.timeout)
+            lock, sessions = self._get_shard(session_id)
+            with lock:
+                sessions[session_id] = session
+            self._add_count(1)
+            with self._heap_lock:
+                heapq.heappush(self._expiry_heap, (session.expires_at, session_id))
+                if len(self._expiry_heap) > 2 * max(self._count, MIN_HEAP_COMPACT):
+                    self._compact_heap()
 
         return session_id
 
@@ -83,13 +251,19 @@ class SessionManager:
         Optional[Session]
             Session object if found and not expired, None otherwise
         """
-        session = self.sessions.get(session_id)
-        if session:
-            if session.is_expired(self.timeout):
-                del self.sessions[session_id]
+        lock, sessions = self._get_shard(session_id)
+        with lock:
+            session = sessions.get(session_id)
+            if session is None:
                 return None
-            session.touch()
-        return session
+            now = _now()
+            if not session.is_expired(now):
+                session.touch(now)
+                sessions.move_to_end(session_id)
+                return session
+            sessions.pop(session_id, None)
+        self._add_count(-1)
+        return None
 
     def get_system(self, session_id: str) -> Optional[System]:
         """
@@ -122,59 +296,188 @@ class SessionManager:
         bool
             True if session was removed, False if not found
         """
-        if session_id in self.sessions:
-            del self.sessions[session_id]
-            return True
-        return False
+        lock, sessions = self._get_shard(session_id)
+        with lock:
+            removed = sessions.pop(session_id, None)
+        if removed is None:
+            return False
+        self._add_count(-1)
+        return True
 
     def list_sessions(self) -> list[dict]:
         """
         List all active sessions.
 
+        Expired sessions that have not been swept yet are skipped.
+
         Returns
         -------
         list[dict]
             List of session metadata
         """
-        self._cleanup_expired()
-        return [
-            {
-                "session_id": sid,
-                "case_path": session.case_path,
-                "created_at": session.created_at,
-                "last_accessed": session.last_accessed,
-            }
-            for sid, session in self.sessions.items()
-        ]
+        now = _now()
+        result = []
+        for lock, sessions in self._shards:
+            with lock:
+                result.extend(session.metadata for session in sessions.values()
+                              if not session.is_expired(now))
+        return result
+
+    def _evict_oldest(self) -> bool:
+        """
+        Remove the least recently accessed session.
+
+        Only the head of each shard is compared, since shards are kept in
+        access order.
+
+        Returns
+        -------
+        bool
+            True if a session was removed
+        """
+        oldest = None
+        for lock, sessions in self._shards:
+            with lock:
+                if sessions:
+                    session = next(iter(sessions.values()))
+                    if oldest is None or session.last_accessed < oldest.last_accessed:
+                        oldest = session
+        if oldest is None:
+            return False
+        return self.close_session(oldest.session_id)
+
+    def _compact_heap(self):
+        """
+        Rebuild the expiry heap from the stored sessions.
+
+        Drops the entries of closed and evicted sessions, which otherwise stay
+        until their original expiry time. Called with `_heap_lock` held, when
+        the heap has grown to twice the number of sessions, so the cost is
+        amortized over the creations that grew it.
+        """
+        heap = []
+        for lock, sessions in self._shards:
+            with lock:
+                heap.extend((session.expires_at, sid) for sid, session in sessions.items())
+        heapq.heapify(heap)
+        self._expiry_heap[:] = heap
 
     def _cleanup_expired(self):
-        """Remove expired sessions"""
-        expired = [
-            sid for sid, session in self.sessions.items()
-            if session.is_expired(self.timeout)
-        ]
-        for sid in expired:
-            del self.sessions[sid]
+        """
+        Remove expired sessions.
 
+        Heap entries are not updated when a session is accessed. An entry that
+        comes due for a session accessed since is pushed back with the new
+        expiry time, and entries of closed sessions are dropped.
+        """
+        now = _now()
+        heap = self._expiry_heap
+        with self._heap_lock:
+            while heap and heap[0][0] < now:
+                _, sid = heapq.heappop(heap)
+                lock, sessions = self._get_shard(sid)
+                with lock:
+                    session = sessions.get(sid)
+                    if session is None:
+                        continue
+                    if not session.is_expired(now):
+                        heapq.heappush(heap, (session.expires_at, sid))
+                        continue
+                    del sessions[sid]
+                self._add_count(-1)
 
-# Global session manager instance
-_session_manager: Optional[SessionManager] = None
+
+class CaseTemplateCache:
+    """
+    LRU cache of freshly loaded ANDES systems used as templates for new sessions.
+
+    Sessions receive deep copies of the templates, so repeated loads of the
+    same case skip the case file parser. The cache is shared by concurrent
+    tool calls; its lock guards only the dictionary, and copies are made
+    outside of it.
+    """
+
+    def __init__(self, max_size: int = 4):
+        self.templates: OrderedDict = OrderedDict()
+        self.max_size = max_size
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[System]:
+        """
+        Get a copy of the cached template system.
+
+        Parameters
+        ----------
+        key : Hashable
+            Cache key identifying the case file and load options
+
+        Returns
+        -------
+        Optional[System]
+            A deep copy of the template if cached, None otherwise
+        """
+        with self._lock:
+            template = self.templates.get(key)
+            if template is None:
+                return None
+            self.templates.move_to_end(key)
+        return copy.deepcopy(template)
+
+    def put(self, key: Hashable, system: System):
+        """
+        Store a pristine copy of a freshly loaded system as a template.
+
+        Parameters
+        ----------
+        key : Hashable
+            Cache key identifying the case file and load options
+        system : System
+            ANDES System object right after `andes.load`
+        """
+        if self.max_size <= 0:
+            return
+        template = copy.deepcopy(system)
+        with self._lock:
+            self.templates[key] = template
+            self.templates.move_to_end(key)
+            while len(self.templates) > self.max_size:
+                self.templates.popitem(last=False)
+
+    def clear(self):
+        """Remove all cached templates"""
+        with self._lock:
+            self.templates.clear()
+
+
+# Global instances, created once at import and shared by all tools
+SESSIONS = SessionManager(
+    max_sessions=MCPConfig.MAX_SESSIONS,
+    timeout=MCPConfig.SESSION_TIMEOUT
+)
+CASE_TEMPLATES = CaseTemplateCache(max_size=MCPConfig.CASE_TEMPLATE_CACHE_SIZE)
 
 
 def get_session_manager() -> SessionManager:
     """
     Get the global SessionManager instance (singleton pattern).
 
+    Tools use `SESSIONS` directly; this accessor is kept for external callers.
+
     Returns
     -------
     SessionManager
         The global session manager
     """
-    global _session_manager
-    if _session_manager is None:
-        from ..config import MCPConfig
-        _session_manager = SessionManager(
-            max_sessions=MCPConfig.MAX_SESSIONS,
-            timeout=MCPConfig.SESSION_TIMEOUT
-        )
-    return _session_manager
+    return SESSIONS
+
+
+def get_case_template_cache() -> CaseTemplateCache:
+    """
+    Get the global CaseTemplateCache instance (singleton pattern).
+
+    Returns
+    -------
+    CaseTemplateCache
+        The global case template cache
+    """
+    return CASE_TEMPLATES
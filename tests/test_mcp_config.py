@@ -0,0 +1,88 @@
+"""
+Tests for the configuration of the MCP server.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+try:
+    from andes.mcp.config import MCPConfig
+    HAVE_MCP = True
+except ImportError:
+    HAVE_MCP = False
+
+
+def touch(path, mtime=None):
+    """Create an empty file and optionally set the mtime of its directory"""
+    with open(path, "w"):
+        pass
+    if mtime is not None:
+        os.utime(os.path.dirname(path), ns=(mtime, mtime))
+
+
+@unittest.skipUnless(HAVE_MCP, "MCP dependencies not available")
+class TestListAllCases(unittest.TestCase):
+    """
+    Tests for `MCPConfig.list_all_cases`.
+    """
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = tmp.name
+        os.mkdir(os.path.join(self.root, "ieee14"))
+        touch(os.path.join(self.root, "ieee14", "ieee14.xlsx"))
+        touch(os.path.join(self.root, "ieee14", "ieee14.RAW"))
+        touch(os.path.join(self.root, "ieee14", "notes.txt"))
+        touch(os.path.join(self.root, "top.xlsx"))
+
+        patches = [
+            mock.patch.object(MCPConfig, "CASES_DIR_STR", self.root),
+            mock.patch.object(MCPConfig, "_cases_cache", None),
+            mock.patch.object(MCPConfig, "_cases_cache_key", None),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_list(self):
+        cases = MCPConfig.list_all_cases()
+        self.assertEqual(cases, ["ieee14/ieee14.RAW", "ieee14/ieee14.xlsx", "top.xlsx"])
+
+        # The returned list is a copy of the cache
+        cases.append("bogus.xlsx")
+        self.assertNotIn("bogus.xlsx", MCPConfig.list_all_cases())
+
+    def test_cache_reused(self):
+        first = MCPConfig.list_all_cases()
+        with mock.patch("andes.mcp.config._scan_case_files") as scan:
+            self.assertEqual(MCPConfig.list_all_cases(), first)
+        scan.assert_not_called()
+
+    def test_invalidate_subdir(self):
+        subdir = os.path.join(self.root, "ieee14")
+        mtime = os.stat(subdir).st_mtime_ns
+        MCPConfig.list_all_cases()
+
+        # Bump the mtime explicitly in case the filesystem timestamps are coarse
+        touch(os.path.join(subdir, "ieee14_new.xlsx"), mtime=mtime + 10**9)
+        self.assertIn("ieee14/ieee14_new.xlsx", MCPConfig.list_all_cases())
+
+        os.remove(os.path.join(subdir, "ieee14_new.xlsx"))
+        os.utime(subdir, ns=(mtime + 2 * 10**9, mtime + 2 * 10**9))
+        self.assertNotIn("ieee14/ieee14_new.xlsx", MCPConfig.list_all_cases())
+
+    def test_invalidate_root(self):
+        mtime = os.stat(self.root).st_mtime_ns
+        MCPConfig.list_all_cases()
+
+        os.mkdir(os.path.join(self.root, "kundur"))
+        touch(os.path.join(self.root, "kundur", "kundur.xlsx"))
+        os.utime(self.root, ns=(mtime + 10**9, mtime + 10**9))
+        self.assertIn("kundur/kundur.xlsx", MCPConfig.list_all_cases())
+
+    def test_missing_dir(self):
+        with mock.patch.object(MCPConfig, "CASES_DIR_STR", os.path.join(self.root, "missing")):
+            self.assertEqual(MCPConfig.list_all_cases(), [])
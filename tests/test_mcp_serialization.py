@@ -0,0 +1,304 @@
+"""
+Tests for result serialization of the MCP server.
+"""
+
+import base64
+import json
+import sys
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import andes
+
+try:
+    from andes.mcp.utils import serialization
+    HAVE_MCP = True
+except ImportError:
+    HAVE_MCP = False
+
+
+@unittest.skipUnless(HAVE_MCP, "MCP dependencies not available")
+class TestNumpyToPython(unittest.TestCase):
+    """
+    Tests for `numpy_to_python`.
+    """
+
+    def assertNative(self, obj, expected):
+        out = serialization.numpy_to_python(obj)
+        self.assertEqual(out, expected)
+        self.assertEqual(json.dumps(out), json.dumps(expected))
+        return out
+
+    def test_scalars(self):
+        for value, expected in ((np.int8(-3), -3), (np.uint64(7), 7), (np.int64(2**40), 2**40),
+                                (np.float16(0.5), 0.5), (np.float32(1.5), 1.5),
+                                (np.float64(0.1), 0.1), (np.bool_(True), True)):
+            out = self.assertNative(value, expected)
+            self.assertIs(type(out), type(expected))
+
+        for value in (1, 2.5, "s", None, True):
+            self.assertIs(serialization.numpy_to_python(value), value)
+
+    def test_arrays(self):
+        self.assertNative(np.arange(3), [0, 1, 2])
+        self.assertNative(np.ones((2, 2), dtype=np.float32), [[1.0, 1.0], [1.0, 1.0]])
+        self.assertNative(np.zeros((0, 3)), [])
+
+        out = self.assertNative(np.array(2.5), 2.5)
+        self.assertIs(type(out), float)
+
+    def test_str(self):
+        out = self.assertNative(np.str_("bus"), "bus")
+        self.assertIsInstance(out, str)
+        self.assertNative([np.str_("a"), {"b": np.str_("c")}], ["a", {"b": "c"}])
+
+    def test_nested(self):
+        obj = {
+            "a": [1, (np.float64(2.0), "x"), np.array([3, 4])],
+            5: {"b": {"c": (np.int32(6),)}, "d": []},
+            "e": ({}, [[np.bool_(False)]]),
+        }
+        expected = {
+            "a": [1, [2.0, "x"], [3, 4]],
+            5: {"b": {"c": [6]}, "d": []},
+            "e": [{}, [[False]]],
+        }
+        out = self.assertNative(obj, expected)
+        self.assertEqual(list(out), ["a", 5, "e"])
+
+        # The input is not modified
+        self.assertIsInstance(obj["a"][1], tuple)
+        self.assertIsInstance(obj["a"][2], np.ndarray)
+
+    def test_deep_nesting(self):
+        depth = 5 * sys.getrecursionlimit()
+        obj = inner = []
+        for _ in range(depth):
+            child = [np.int64(1)]
+            inner.append(child)
+            inner = child
+
+        out = serialization.numpy_to_python(obj)
+        for _ in range(depth):
+            self.assertIs(type(out[-1]), list)
+            out = out[-1]
+            self.assertIs(type(out[0]), int)
+        self.assertEqual(out, [1])
+
+
+@unittest.skipUnless(HAVE_MCP, "MCP dependencies not available")
+class TestCompressJson(unittest.TestCase):
+    """
+    Tests for `compress_json`.
+    """
+
+    obj = {"time": np.linspace(0, 10, 20000), "name": "v Bus 1", 1: [np.int64(2)]}
+
+    @unittest.skipIf(HAVE_MCP and serialization.zstandard is None, "zstandard not available")
+    def test_roundtrip(self):
+        blob = serialization.to_json_bytes(self.obj)
+        res = serialization.compress_json(self.obj)
+
+        self.assertEqual(res["compression"], "zstd")
+        self.assertEqual(res["size"], len(blob))
+        data = base64.b64decode(res["data"])
+        self.assertLess(len(data), len(blob))
+        self.assertEqual(serialization.zstandard.ZstdDecompressor().decompress(data), blob)
+
+    @unittest.skipIf(HAVE_MCP and serialization.zstandard is None, "zstandard not available")
+    def test_min_size(self):
+        self.assertIsNone(serialization.compress_json({"a": 1}))
+        size = len(serialization.to_json_bytes(self.obj))
+        self.assertIsNone(serialization.compress_json(self.obj, min_size=size + 1))
+        self.assertIsNotNone(serialization.compress_json(self.obj, min_size=size))
+
+    def test_missing_zstandard(self):
+        with mock.patch.object(serialization, "zstandard", None):
+            with self.assertRaises(ImportError):
+                serialization.compress_json(self.obj)
+
+
+@unittest.skipUnless(HAVE_MCP, "MCP dependencies not available")
+class TestRoundSignificant(unittest.TestCase):
+    """
+    Tests for `round_significant`.
+    """
+
+    def test_round(self):
+        out = serialization.round_significant(np.array([1.23456789, -9.87654321e-5, 123456789.0]), 4)
+        np.testing.assert_array_equal(out, [1.235, -9.877e-5, 123500000.0])
+
+    def test_zero_and_nonfinite(self):
+        arr = np.array([0.0, -0.0, np.inf, -np.inf, np.nan])
+        with np.errstate(all='raise'):
+            out = serialization.round_significant(arr, 7)
+        np.testing.assert_array_equal(out, arr)
+
+    def test_tiny_and_huge(self):
+        arr = np.array([1e-310, 5e-324, 1e-303, 1.7976931348623157e308])
+        with np.errstate(all='raise'):
+            out = serialization.round_significant(arr, 7)
+        np.testing.assert_array_equal(out, arr)
+
+        out = serialization.round_significant(np.array([1.234567891e-290]), 7)
+        self.assertEqual(out.tolist(), [1.234568e-290])
+
+
+@unittest.skipUnless(HAVE_MCP, "MCP dependencies not available")
+class TestMinMaxDownsample(unittest.TestCase):
+    """
+    Tests for min-max bucket downsampling.
+    """
+
+    def test_lengths(self):
+        t = np.arange(10.0)
+        block = np.arange(20.0).reshape(10, 2)
+        for bucket, n_out in ((1, 20), (3, 8), (4, 6), (10, 2), (20, 2)):
+            self.assertEqual(serialization._minmax_downsample(block, bucket).shape, (n_out, 2))
+            self.assertEqual(serialization._minmax_time(t, bucket).shape, (n_out,))
+
+    def test_time_bounds(self):
+        t = np.arange(10.0)
+        np.testing.assert_array_equal(serialization._minmax_time(t, 4),
+                                      [0, 3, 4, 7, 8, 9])
+
+    def test_order_and_padding(self):
+        # The extremum that occurs first in a bucket comes first; the last
+        # bucket holds a single row
+        block = np.array([[0.0, 0.0],
+                          [5.0, -5.0],
+                          [-5.0, 5.0],
+                          [1.0, 1.0],
+                          [2.0, 2.0],
+                          [9.0, -9.0],
+                          [-9.0, 9.0]])
+        out = serialization._minmax_downsample(block, 3)
+        np.testing.assert_array_equal(out[:, 0], [5, -5, 1, 9, -9, -9])
+        np.testing.assert_array_equal(out[:, 1], [-5, 5, 2, -9, 9, 9])
+
+    def test_max_points(self):
+        t = np.linspace(0, 1, 101)
+        for max_points in (2, 3, 10, 11, 100):
+            downsampled, step, bucket, time_array = serialization._plan_sampling(t, max_points, "minmax")
+            self.assertTrue(downsampled)
+            self.assertGreater(bucket, 0)
+            self.assertLessEqual(len(time_array), max_points)
+
+        # Buckets need two points, so fall back to a stride
+        downsampled, step, bucket, time_array = serialization._plan_sampling(t, 1, "minmax")
+        self.assertEqual(bucket, 0)
+        self.assertEqual(step, 101)
+        self.assertEqual(len(time_array), 1)
+
+
+@unittest.skipUnless(HAVE_MCP, "MCP dependencies not available")
+class TestSampleRows(unittest.TestCase):
+    """
+    Tests for `_sample_rows` column gathering.
+    """
+
+    def test_stride(self):
+        ts = np.arange(200.0).reshape(20, 10)
+        cols = [7, 2, 5]
+        for step in (1, 3, 20):
+            np.testing.assert_array_equal(serialization._sample_rows(ts, cols, step, 0),
+                                          ts[::step][:, cols])
+        np.testing.assert_array_equal(serialization._sample_rows(ts, None, 4, 0), ts[::4])
+        self.assertEqual(serialization._sample_rows(ts, [], 1, 0).shape, (20, 0))
+
+    def test_minmax(self):
+        ts = np.random.default_rng(0).random((20, 10))
+        np.testing.assert_array_equal(serialization._sample_rows(ts, [3, 1], 1, 4),
+                                      serialization._minmax_downsample(ts[:, [3, 1]], 4))
+
+
+@unittest.skipUnless(HAVE_MCP, "MCP dependencies not available")
+class TestSerializeTDS(unittest.TestCase):
+    """
+    Tests for `serialize_tds_results`.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ss = andes.run(andes.get_case('kundur/kundur_full.xlsx'),
+                           no_output=True, default_config=True)
+        cls.ss.TDS.config.tf = 0.5
+        cls.ss.TDS.config.no_tqdm = True
+        cls.ss.TDS.run()
+        cls.names = ['v Bus 1', 'unknown', 'omega GENROU 2', 'a Bus 3', 'delta GENROU 1']
+        cls.known = ['v Bus 1', 'omega GENROU 2', 'a Bus 3', 'delta GENROU 1']
+
+    def test_json_order(self):
+        res = serialization.serialize_tds_results(self.ss, variables=self.names, dtype='float64')
+        self.assertEqual(list(res['variables']), self.known)
+
+        ts = self.ss.dae.ts
+        np.testing.assert_array_equal(res['variables']['omega GENROU 2'],
+                                      ts.x[:, self.ss.dae.x_name.index('omega GENROU 2')])
+        np.testing.assert_array_equal(res['variables']['v Bus 1'],
+                                      ts.y[:, self.ss.dae.y_name.index('v Bus 1')])
+
+    def test_binary_order(self):
+        res = serialization.serialize_tds_results(self.ss, variables=self.names, encoding='binary',
+                                                  dtype='float64')
+        self.assertEqual(list(res['variables']), self.known)
+
+        json_res = serialization.serialize_tds_results(self.ss, variables=self.names, dtype='float64')
+        for name, enc in res['variables'].items():
+            data = np.frombuffer(base64.b64decode(enc['data']), dtype='<f8')
+            np.testing.assert_array_equal(data, json_res['variables'][name])
+
+    @unittest.skipIf(HAVE_MCP and serialization.pa is None, "pyarrow not available")
+    def test_arrow_order(self):
+        pa = serialization.pa
+        res = serialization.serialize_tds_results(self.ss, variables=self.names, encoding='arrow',
+                                                  dtype='float64')
+        self.assertEqual(res['variables'], self.known)
+
+        table = pa.ipc.open_stream(base64.b64decode(res['data'])).read_all()
+        self.assertEqual(table.column_names, ['time'] + self.known)
+
+    def test_minmax(self):
+        res = serialization.serialize_tds_results(self.ss, variables=self.names, max_points=6,
+                                                  downsample='minmax', dtype='float64')
+        self.assertEqual(list(res['variables']), self.known)
+        self.assertEqual(res['downsample_method'], 'minmax')
+        self.assertLessEqual(len(res['time']), 6)
+
+        col = self.ss.dae.ts.y[:, self.ss.dae.y_name.index('a Bus 3')]
+        self.assertEqual(max(res['variables']['a Bus 3']), col.max())
+        self.assertEqual(min(res['variables']['a Bus 3']), col.min())
+
+        res = serialization.serialize_tds_results(self.ss, max_points=1, downsample='minmax')
+        self.assertEqual(res['downsample_method'], 'stride')
+        self.assertEqual(len(res['time']), 1)
+
+    def test_iter_ndjson(self):
+        for kwargs in ({}, {"variables": self.names, "max_points": 6, "downsample": "minmax"},
+                       {"variables": self.names, "max_points": 7, "dtype": "float64"}):
+            res = json.loads(json.dumps(serialization.serialize_tds_results(self.ss, **kwargs)))
+            lines = [json.loads(line) for line in serialization.iter_tds_results(self.ss, **kwargs)]
+
+            meta = lines[0]
+            self.assertEqual(meta.pop("variables"), list(res.pop("variables")))
+            self.assertEqual(meta, res)
+            self.assertEqual({line["name"]: line["data"] for line in lines[1:]},
+                             serialization.serialize_tds_results(self.ss, **kwargs)["variables"])
+
+        with self.assertRaises(ValueError):
+            next(serialization.iter_tds_results(self.ss, dtype='int8'))
+
+    def test_var_index_cache(self):
+        dae = self.ss.dae
+        index = serialization.get_var_index(dae)
+        self.assertIs(serialization.get_var_index(dae), index)
+        self.assertEqual(index['omega GENROU 2'], ('x', dae.x_name.index('omega GENROU 2')))
+        self.assertEqual(index['v Bus 1'], ('y', dae.y_name.index('v Bus 1')))
+
+    def test_bad_options(self):
+        with self.assertRaises(ValueError):
+            serialization.serialize_tds_results(self.ss, encoding='xml')
+        with self.assertRaises(ValueError):
+            serialization.serialize_tds_results(self.ss, dtype='int8')
@@ -0,0 +1,195 @@
+"""
+Tests for session management of the MCP server.
+"""
+
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+try:
+    from andes.mcp.utils import session as session_mod
+    from andes.mcp.utils.session import CaseTemplateCache, SessionManager
+    HAVE_MCP = True
+except ImportError:
+    HAVE_MCP = False
+
+
+def make_system():
+    """Minimal stand-in for an ANDES System"""
+    dae = SimpleNamespace(n=0, m=0, t=0.0, x_name=[], y_name=[])
+    return SimpleNamespace(dae=dae, is_setup=True)
+
+
+class FakeClock:
+    """Manually advanced replacement for the session clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@unittest.skipUnless(HAVE_MCP, "MCP dependencies not available")
+class TestSessionManager(unittest.TestCase):
+    """
+    Tests for `SessionManager`.
+    """
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch.object(session_mod, '_now', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.managers = []
+
+    def tearDown(self):
+        for manager in self.managers:
+            manager.stop_sweeper()
+
+    def make_manager(self, **kwargs):
+        manager = SessionManager(**kwargs)
+        self.managers.append(manager)
+        return manager
+
+    def assertCountConsistent(self, manager):
+        stored = sum(len(sessions) for _, sessions in manager._shards)
+        self.assertEqual(len(manager), stored)
+
+    def test_create_get_close(self):
+        manager = self.make_manager(max_sessions=10, timeout=100)
+        sid = manager.create_session(make_system(), "case.xlsx")
+
+        self.assertEqual(manager.get_session(sid).case_path, "case.xlsx")
+        self.assertIsNone(manager.get_session("missing"))
+        self.assertEqual(len(manager), 1)
+
+        self.assertTrue(manager.close_session(sid))
+        self.assertFalse(manager.close_session(sid))
+        self.assertIsNone(manager.get_session(sid))
+        self.assertEqual(len(manager), 0)
+        self.assertCountConsistent(manager)
+
+    def test_expiry(self):
+        manager = self.make_manager(max_sessions=10, timeout=100)
+        old = manager.create_session(make_system(), "old")
+        self.clock.now += 60
+        new = manager.create_session(make_system(), "new")
+
+        # Access resets the expiry time
+        self.clock.now += 60
+        self.assertIsNotNone(manager.get_session(new))
+        self.assertEqual(len(manager.list_sessions()), 1)
+
+        # Expired session is removed on lookup
+        self.assertIsNone(manager.get_session(old))
+        self.assertEqual(len(manager), 1)
+        self.assertCountConsistent(manager)
+
+        self.clock.now += 101
+        self.assertEqual(manager.list_sessions(), [])
+        manager._cleanup_expired()
+        self.assertEqual(len(manager), 0)
+        self.assertEqual(manager._expiry_heap, [])
+        self.assertCountConsistent(manager)
+
+    def test_cleanup_keeps_accessed(self):
+        manager = self.make_manager(max_sessions=10, timeout=100)
+        sid = manager.create_session(make_system(), "a")
+        self.clock.now += 90
+        manager.get_session(sid)
+
+        # The original heap entry is due, but the session was accessed since
+        self.clock.now += 20
+        manager._cleanup_expired()
+        self.assertIsNotNone(manager.get_session(sid))
+        self.assertCountConsistent(manager)
+
+    def test_heap_compaction(self):
+        manager = self.make_manager(max_sessions=1000, timeout=1000)
+        keep = manager.create_session(make_system(), "keep")
+        for _ in range(500):
+            manager.close_session(manager.create_session(make_system(), "churn"))
+
+        self.assertLessEqual(len(manager._expiry_heap), 2 * session_mod.MIN_HEAP_COMPACT + 1)
+        self.assertIn(keep, [sid for _, sid in manager._expiry_heap])
+
+        # Compaction keeps the accessed expiry time
+        self.clock.now += 500
+        manager.get_session(keep)
+        manager._compact_heap()
+        self.assertEqual(manager._expiry_heap, [(self.clock.now + 1000, keep)])
+
+        with mock.patch.object(manager, "max_sessions", 2):
+            for _ in range(100):
+                manager.create_session(make_system(), "evict")
+        self.assertLessEqual(len(manager._expiry_heap), 2 * session_mod.MIN_HEAP_COMPACT + 1)
+        self.assertCountConsistent(manager)
+
+    def test_lru_eviction(self):
+        manager = self.make_manager(max_sessions=3, timeout=1000)
+        sids = []
+        for i in range(3):
+            sids.append(manager.create_session(make_system(), str(i)))
+            self.clock.now += 1
+
+        manager.get_session(sids[0])
+        self.clock.now += 1
+        manager.create_session(make_system(), "3")
+
+        cases = sorted(meta["case_path"] for meta in manager.list_sessions())
+        self.assertEqual(cases, ["0", "2", "3"])
+        self.assertEqual(len(manager), 3)
+        self.assertCountConsistent(manager)
+
+    def test_concurrent(self):
+        manager = self.make_manager(max_sessions=1000, timeout=1000)
+
+        def work():
+            for _ in range(200):
+                sid = manager.create_session(make_system(), "x")
+                manager.get_session(sid)
+                manager.close_session(sid)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(manager), 0)
+        self.assertCountConsistent(manager)
+
+
+@unittest.skipUnless(HAVE_MCP, "MCP dependencies not available")
+class TestCaseTemplateCache(unittest.TestCase):
+    """
+    Tests for `CaseTemplateCache`.
+    """
+
+    def test_lru(self):
+        cache = CaseTemplateCache(max_size=2)
+        cache.put("a", ["a"])
+        cache.put("b", ["b"])
+        self.assertEqual(cache.get("a"), ["a"])
+        cache.put("c", ["c"])
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(list(cache.templates), ["a", "c"])
+
+    def test_copies(self):
+        cache = CaseTemplateCache(max_size=2)
+        system = ["a"]
+        cache.put("a", system)
+        system.append("changed")
+
+        copy = cache.get("a")
+        self.assertEqual(copy, ["a"])
+        copy.append("changed")
+        self.assertEqual(cache.get("a"), ["a"])
+
+    def test_disabled(self):
+        cache = CaseTemplateCache(max_size=0)
+        cache.put("a", ["a"])
+        self.assertIsNone(cache.get("a"))
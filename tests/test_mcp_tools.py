@@ -0,0 +1,150 @@
+"""
+Tests for the MCP server tools.
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+try:
+    from fastmcp import Client
+
+    from andes.mcp.server import mcp
+    from andes.mcp.utils import CASE_TEMPLATES, SESSIONS, serialization
+    HAVE_MCP = True
+except ImportError:
+    HAVE_MCP = False
+
+
+def call_tool(name, **kwargs):
+    """Call an MCP tool in a fresh client and return its result dict"""
+    async def run():
+        async with Client(mcp) as client:
+            result = await client.call_tool(name, kwargs)
+            return json.loads(result.content[0].text)
+    return asyncio.run(run())
+
+
+@unittest.skipUnless(HAVE_MCP, "MCP dependencies not available")
+class TestLoadCase(unittest.TestCase):
+    """
+    Tests for `load_case` and the case template cache.
+    """
+
+    case = "ieee14/ieee14_full.xlsx"
+
+    def setUp(self):
+        CASE_TEMPLATES.clear()
+        self.sessions = []
+
+    def tearDown(self):
+        for sid in self.sessions:
+            SESSIONS.close_session(sid)
+        CASE_TEMPLATES.clear()
+
+    def load(self):
+        res = call_tool("load_case", case_path=self.case)
+        self.assertTrue(res["success"], res)
+        self.sessions.append(res["session_id"])
+        return res
+
+    def test_disabled_by_default(self):
+        self.load()
+        self.assertEqual(len(CASE_TEMPLATES.templates), 0)
+
+    def test_template_reuse(self):
+        with mock.patch.object(CASE_TEMPLATES, "max_size", 2):
+            first = self.load()
+            self.assertEqual(len(CASE_TEMPLATES.templates), 1)
+            second = self.load()
+            self.assertEqual(len(CASE_TEMPLATES.templates), 1)
+
+        self.assertEqual(first["system_info"], second["system_info"])
+
+        # Each session owns an independent copy
+        sys1 = SESSIONS.get_system(first["session_id"])
+        sys2 = SESSIONS.get_system(second["session_id"])
+        self.assertIsNot(sys1, sys2)
+        self.assertIsNot(sys1.Bus.v.v, sys2.Bus.v.v)
+
+        res = call_tool("run_power_flow", session_id=second["session_id"])
+        self.assertTrue(res["converged"])
+        self.assertFalse(sys1.PFlow.converged)
+
+    def test_missing_case(self):
+        res = call_tool("load_case", case_path="missing/missing.xlsx")
+        self.assertFalse(res["success"])
+        self.assertIn("not found", res["error"])
+
+
+@unittest.skipUnless(HAVE_MCP, "MCP dependencies not available")
+class TestExportTDS(unittest.TestCase):
+    """
+    Tests for `export_tds_results`.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        res = call_tool("load_case", case_path="kundur/kundur_full.xlsx")
+        cls.sid = res["session_id"]
+        call_tool("run_power_flow", session_id=cls.sid)
+        SESSIONS.get_system(cls.sid).TDS.config.no_tqdm = True
+        call_tool("run_time_domain", session_id=cls.sid, tf=0.5)
+
+    @classmethod
+    def tearDownClass(cls):
+        SESSIONS.close_session(cls.sid)
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = os.path.join(self.tmpdir.name, "tds.ndjson")
+
+    def test_session_var_index(self):
+        session = SESSIONS.get_session(self.sid)
+        self.assertIs(session.get_var_index(), serialization.get_var_index(session.system.dae))
+
+    def test_system_info_cache(self):
+        session = SESSIONS.get_session(self.sid)
+        info = session.get_system_info()
+        self.assertIs(session.get_system_info(), info)
+        self.assertEqual(info, serialization.serialize_system_info(session.system))
+        self.assertEqual(info["dae_info"]["time"], session.system.dae.t)
+
+        # A change in simulation time invalidates the cached info
+        session.system.dae.t += 1.0
+        try:
+            self.assertEqual(session.get_system_info()["dae_info"]["time"], info["dae_info"]["time"] + 1.0)
+        finally:
+            session.system.dae.t -= 1.0
+
+    def test_export(self):
+        names = ["omega GENROU 1", "unknown", "v Bus 2"]
+        res = call_tool("export_tds_results", session_id=self.sid, path=self.path,
+                        variables=names, dtype="float64")
+        self.assertTrue(res["success"], res)
+        self.assertEqual(res["n_variables"], 2)
+        self.assertEqual(res["size"], os.path.getsize(self.path))
+
+        with open(self.path) as f:
+            lines = [json.loads(line) for line in f]
+        expected = call_tool("get_tds_results", session_id=self.sid, variables=names,
+                             max_points=100000, dtype="float64")
+        self.assertEqual(lines[0]["time"], expected["time"])
+        self.assertEqual({line["name"]: line["data"] for line in lines[1:]}, expected["variables"])
+
+    def test_no_overwrite(self):
+        with open(self.path, "w") as f:
+            f.write("keep")
+        res = call_tool("export_tds_results", session_id=self.sid, path=self.path)
+        self.assertFalse(res["success"])
+        with open(self.path) as f:
+            self.assertEqual(f.read(), "keep")
+
+    def test_bad_dtype(self):
+        res = call_tool("export_tds_results", session_id=self.sid, path=self.path, dtype="int8")
+        self.assertFalse(res["success"])
+        self.assertFalse(os.path.exists(self.path))